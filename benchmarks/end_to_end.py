@@ -0,0 +1,243 @@
+#! /usr/bin/env python
+"""End-to-end benchmarks of `sort`, `update` and batch inserts against the offline YouTube stand-in in fake_youtube.py.
+
+Reports wall time, HTTP round trips, TCP connections opened and quota charged for each scenario. The daily quota
+cap is lifted so every scenario runs to completion rather than stopping where a real account would for the day.
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import arrow
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_youtube import FakeYoutube  # noqa: E402
+
+import playlist_updates  # noqa: E402
+
+SORT_SIZES = [50, 500, 5_000]
+UPDATE_CHANNELS = [10, 100, 1_000]
+INSERT_SIZES = [50, 500, 5_000]
+# Every this many videos to insert, one is already in the playlist
+DUPLICATE_EVERY = 5
+# Well above anything the stand-in needs, so update scenarios measure the pipeline rather than the rate limiter
+UPDATE_RATE_LIMIT = 1_000.0
+
+
+class AnonymousCredentials:
+    """The stand-in doesn't check auth, so skip the OAuth flow entirely."""
+
+    access_token = 'anonymous'
+    access_token_expired = False
+
+    def authorize(self, http):
+        return http
+
+    def apply(self, headers):
+        pass
+
+
+@contextlib.contextmanager
+def fake_api(fake):
+    """Point playlist_updates at `fake`, with empty local state, for the duration of the block."""
+    with tempfile.TemporaryDirectory() as cache_dir, fake:
+        playlist_updates.YOUTUBE_API_ROOT_URL = fake.root_url
+        playlist_updates.YOUTUBE_FEED_URL = fake.feed_url
+        playlist_updates.CACHE_DIR = Path(cache_dir)
+        playlist_updates.DAILY_QUOTA = 10**9
+        playlist_updates.YoutubeManager.get_creds = staticmethod(AnonymousCredentials)
+        for cached in (playlist_updates.get_discovery_document, playlist_updates.read_config):
+            cached.cache_clear()
+        playlist_updates.get_quota_ledger.cache_clear()
+        yield
+
+
+def run(fake, action, output=None):
+    """Run `action` against `fake`, returning (seconds, http calls, connections, quota).
+
+    The app's output is hidden, or captured in `output` if given.
+    """
+    fake.reset_counters()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output or io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        action()
+    return time.perf_counter() - start, fake.http_calls, fake.connections, fake.quota_used
+
+
+def allow_all_channels(fake):
+    """Put every channel `fake` has into the update allowlist."""
+    config = playlist_updates.read_config()
+    config['auto_add'] = [
+        {'id': channel_id, 'name': channel_id, 'uploads': 'UU' + channel_id[2:]} for channel_id in fake.uploads
+    ]
+
+
+def bench_sort(size, latency):
+    fake = FakeYoutube(latency=latency)
+    video_ids = [video for channel in range(max(size // 10, 1)) for video in fake.add_channel(f'UCsort{channel}', 10)]
+    video_ids = video_ids[:size]
+    random.Random(size).shuffle(video_ids)
+    fake.add_to_playlist(video_ids)
+
+    with fake_api(fake):
+        result = run(fake, playlist_updates.YoutubeManager(dry_run=False).sort)
+
+        infos = {i: fake.videos[i] for i in video_ids}
+        expected = sorted(video_ids, key=lambda i: f"{infos[i]['channelId']}-{infos[i]['publishedAt']}")
+        assert [i['videoId'] for i in fake.playlist] == expected, 'playlist not sorted'
+    return result
+
+
+def bench_update(channels, latency, requests_per_second, use_feeds=False):
+    fake = FakeYoutube(latency=latency)
+    for channel in range(channels):
+        fake.add_channel(f'UCupdate{channel}', 5)
+
+    with fake_api(fake):
+        allow_all_channels(fake)
+        manager = playlist_updates.YoutubeManager(dry_run=False)
+        output = io.StringIO()
+        result = run(
+            fake,
+            lambda: manager.update(
+                arrow.get('2025-12-29'), requests_per_second=requests_per_second, use_feeds=use_feeds
+            ),
+            output,
+        )
+
+        assert len(fake.playlist) == channels * 4, 'unexpected number of inserts'
+        if use_feeds:
+            assert f'{channels} read from feeds' in output.getvalue(), 'feeds not read'
+            assert fake.uploads_pages == 0, 'uploads pages fetched despite feeds'
+    return result
+
+
+def bench_update_feeds(channels, latency, requests_per_second):
+    return bench_update(channels, latency, requests_per_second, use_feeds=True)
+
+
+def bench_update_feeds_overflow(channels, latency, requests_per_second):
+    """Feeds for every other channel miss part of the window, so those channels fall back to the API."""
+    fake = FakeYoutube(latency=latency)
+    busy = channels // 2
+    busy_uploads = playlist_updates.FEED_SIZE + 5
+    for channel in range(channels):
+        if channel < busy:
+            fake.add_channel(f'UCupdate{channel}', busy_uploads, spacing=timedelta(hours=1))
+        else:
+            fake.add_channel(f'UCupdate{channel}', 5)
+
+    with fake_api(fake):
+        allow_all_channels(fake)
+        manager = playlist_updates.YoutubeManager(dry_run=False)
+        output = io.StringIO()
+        result = run(
+            fake,
+            lambda: manager.update(arrow.get('2025-12-29'), requests_per_second=requests_per_second, use_feeds=True),
+            output,
+        )
+
+        assert f'{channels - busy} read from feeds' in output.getvalue(), 'unexpected feed reads'
+        assert fake.uploads_pages == busy, 'overflowing feeds not fetched from the API'
+        assert len(fake.playlist) == busy * busy_uploads + (channels - busy) * 4, 'unexpected number of inserts'
+    return result
+
+
+def bench_update_unchanged(channels, latency, requests_per_second):
+    """A second update with nothing new: every uploads page comes back 304, so nothing is parsed or inserted."""
+    fake = FakeYoutube(latency=latency)
+    for channel in range(channels):
+        fake.add_channel(f'UCupdate{channel}', 5)
+
+    with fake_api(fake):
+        allow_all_channels(fake)
+        manager = playlist_updates.YoutubeManager(dry_run=False)
+        run(fake, lambda: manager.update(arrow.get('2025-12-29'), requests_per_second=requests_per_second))
+        inserted = len(fake.playlist)
+
+        # From each channel's watermark, as a scheduled run would; the first pages are now older than the window
+        output = io.StringIO()
+        result = run(fake, lambda: manager.update(None, requests_per_second=requests_per_second), output)
+
+        assert f'{channels} unchanged since last seen' in output.getvalue(), 'uploads pages not conditional'
+        assert fake.uploads_pages == 0, 'unchanged uploads pages served in full'
+        assert len(fake.playlist) == inserted, 'unexpected inserts'
+    return result
+
+
+def bench_insert_duplicates(size, latency):
+    """Batch-insert videos without a playlist index, some already in the playlist, so the batch returns 409s."""
+    fake = FakeYoutube(latency=latency)
+    video_ids = fake.add_channel('UCinsert', size)
+    duplicates = video_ids[::DUPLICATE_EVERY]
+    fake.add_to_playlist(duplicates)
+    videos = [
+        playlist_updates.ChannelVideo(i, fake.videos[i]['title'], 0, fake.videos[i]['channelId']) for i in video_ids
+    ]
+
+    with fake_api(fake):
+        manager = playlist_updates.YoutubeManager(dry_run=False)
+        output = io.StringIO()
+        result = run(fake, lambda: manager.insert_videos_watch_later(videos), output)
+
+        new = [i for i in video_ids if i not in duplicates]
+        assert [i['videoId'] for i in fake.playlist] == duplicates + new, 'unexpected playlist contents'
+        assert output.getvalue().count('Already in list, skipping!') == len(duplicates), 'unexpected skips'
+        assert output.getvalue().count('Added video to playlist') == len(new), 'unexpected inserts'
+
+        # Everything is a duplicate now, and today's quota only covers retrying two of them
+        ledger = playlist_updates.get_quota_ledger()
+        playlist_updates.DAILY_QUOTA = ledger.used + (size + 2) * playlist_updates.INSERT_COST
+        inserted = []
+        run(fake, lambda: inserted.extend(manager.insert_videos_watch_later(videos)))
+        assert inserted == videos[:2], 'conflicts retried beyond the quota'
+        assert ledger.remaining < playlist_updates.INSERT_COST, 'quota not spent on retries'
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--latency', type=float, default=20, help='Simulated latency per HTTP call, in ms.')
+    parser.add_argument('--quick', action='store_true', help='Only run the smallest scenario of each kind.')
+    parser.add_argument(
+        '--rate-limit',
+        type=float,
+        default=UPDATE_RATE_LIMIT,
+        help='API requests per second that update scenarios fetch channels at.',
+    )
+    args = parser.parse_args()
+
+    latency = args.latency / 1000
+    updates = [
+        ('update {} channels', functools.partial(bench_update, requests_per_second=args.rate_limit)),
+        ('update {} ch. (feeds)', functools.partial(bench_update_feeds, requests_per_second=args.rate_limit)),
+        (
+            'update {} ch. (feeds+)',
+            functools.partial(bench_update_feeds_overflow, requests_per_second=args.rate_limit),
+        ),
+        ('update {} ch. (again)', functools.partial(bench_update_unchanged, requests_per_second=args.rate_limit)),
+    ]
+    scenarios = [(f'sort {size} items', bench_sort, size) for size in SORT_SIZES]
+    scenarios += [(name.format(count), bench, count) for name, bench in updates for count in UPDATE_CHANNELS]
+    scenarios += [(f'insert {size} (1/{DUPLICATE_EVERY} dup.)', bench_insert_duplicates, size) for size in INSERT_SIZES]
+    if args.quick:
+        scenarios = scenarios[:: len(SORT_SIZES)]
+
+    print(f'Update scenarios fetch channels at up to {args.rate_limit:g} API requests per second')
+    print(f"{'scenario':<24} {'wall time':>10} {'http calls':>11} {'connections':>12} {'quota':>8}")
+    for name, bench, size in scenarios:
+        seconds, http_calls, connections, quota = bench(size, latency)
+        print(f'{name:<24} {seconds:9.2f}s {http_calls:11} {connections:12} {quota:8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,446 @@
+"""Offline stand-in for the parts of the YouTube Data API v3 that playlist_updates uses.
+
+Serves `playlists`, `playlistItems`, `videos`, `channels` and `subscriptions` (list, plus playlistItems insert and
+update) and the multipart `batch` endpoint from in-memory state, with pagination, ETags, simulated latency, quota
+charges, 409 duplicate inserts and optional 403 rateLimitExceeded errors. Resources carry the same bulky fields as
+real responses (descriptions, thumbnails, localizations), and `fields` partial-response masks are applied, so a mask
+that leaves out something the app reads breaks it here too. It also serves each channel's public Atom feed of its
+latest uploads, which costs no quota. Point the app at it by setting YOUTUBE_API_ROOT_URL to
+`FakeYoutube.root_url`, and YOUTUBE_FEED_URL to `FakeYoutube.feed_url`.
+"""
+
+import email.parser
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+WATCH_LATER_ID = 'PLsortwatchlater'
+API_PREFIX = '/youtube/v3/'
+FEED_PATH = '/feeds/videos.xml'
+FEED_SIZE = 15
+WRITE_COST = 50
+DESCRIPTION = (
+    'New video every week! In this one we go through everything you need to know, step by step, with timestamps '
+    'below.\n\n00:00 Intro\n01:12 Setup\n04:35 The main event\n12:02 Results\n15:40 Outro\n\nSupport the channel: '
+    'https://example.com/support\nMerch: https://example.com/merch\nSocials: https://example.com/social\n\n'
+    'Music by Example Artist, licensed under CC BY 4.0. Thanks to everyone who helped make this video possible, and '
+    "to you for watching. Don't forget to like and subscribe for more!\n\n#example #video #weekly"
+)
+THUMBNAIL_SIZES = {'default': (120, 90), 'medium': (320, 180), 'high': (480, 360), 'standard': (640, 480)}
+
+
+class FakeYoutube:
+    def __init__(self, latency=0.0, rate_limit_error_rate=0.0, seed=0):
+        self.latency = latency
+        self.rate_limit_error_rate = rate_limit_error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+        self.videos = {}  # video id -> {'channelId', 'title', 'publishedAt', 'duration'}
+        self.uploads = {}  # channel id -> video ids, newest-first
+        self.subscriptions = []  # channel ids
+        self.playlist = []  # Sort Watch Later items, in position order: {'id', 'videoId'}
+        self.next_item_id = 0
+
+        self.reset_counters()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def root_url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    @property
+    def feed_url(self):
+        return self.root_url.rstrip('/') + FEED_PATH
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reset_counters(self):
+        self.http_calls = 0
+        self.connections = 0
+        self.uploads_pages = 0  # Full (not 304) pages of channel uploads served
+        self.quota_used = 0
+
+    # Seeding
+
+    def add_channel(self, channel_id, video_count, newest=None, spacing=timedelta(days=1), scheduled=timedelta(0)):
+        """Add a subscribed channel with `video_count` uploads, newest-first, `spacing` apart.
+
+        Each video is uploaded `scheduled` before it's published, as scheduled uploads and premieres are; its uploads
+        playlist item carries the upload time, and the video itself the publish time.
+        """
+        newest = newest or datetime(2026, 1, 1, tzinfo=timezone.utc)
+        video_ids = []
+        for index in range(video_count):
+            video_id = f'{channel_id}-{index:05}'
+            published = newest - spacing * index
+            self.videos[video_id] = {
+                'channelId': channel_id,
+                'title': f'{channel_id} video {index}',
+                'publishedAt': published.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'uploadedAt': (published - scheduled).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'duration': f'PT{1 + index % 59}M{index % 60}S',
+            }
+            video_ids.append(video_id)
+        self.uploads[channel_id] = video_ids
+        self.subscriptions.append(channel_id)
+        return video_ids
+
+    def add_to_playlist(self, video_ids):
+        for video_id in video_ids:
+            self.playlist.append({'id': f'item{self.next_item_id}', 'videoId': video_id})
+            self.next_item_id += 1
+
+    # Request handling
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # Keep-alive, like the real API, so connection reuse shows up
+            disable_nagle_algorithm = True  # Headers and body are separate writes
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                with fake.lock:
+                    fake.connections += 1
+
+            def _handle(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                time.sleep(fake.latency)
+                with fake.lock:
+                    fake.http_calls += 1
+                headers = {name.lower(): value for name, value in self.headers.items()}
+                status, headers, content = fake.handle(self.command, self.path, headers, body)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = _handle
+
+        return Handler
+
+    def handle(self, method, path, headers, body):
+        url = urlsplit(path)
+        if url.path == '/batch':
+            return self._handle_batch(headers, body)
+        if url.path == FEED_PATH:
+            return self._handle_feed(parse_qs(url.query)['channel_id'][0])
+
+        status, payload = self._handle_api(method, path, headers, body)
+        content = json.dumps(payload).encode() if payload is not None else b''
+        return status, {'Content-Type': 'application/json'}, content
+
+    def _handle_batch(self, headers, body):
+        message = email.parser.BytesParser().parsebytes(
+            f"Content-Type: {headers['content-type']}\r\n\r\n".encode() + body
+        )
+        boundary = 'fake_batch_boundary'
+        parts = []
+        for part in message.get_payload():
+            request_line, _, rest = part.get_payload().replace('\r\n', '\n').partition('\n')
+            raw_headers, _, part_body = rest.partition('\n\n')
+            part_headers = {
+                name.lower(): value for name, value in (line.split(': ', 1) for line in raw_headers.split('\n') if line)
+            }
+            method, path, _ = request_line.split(' ', 2)
+            status, payload = self._handle_api(method, path, part_headers, part_body.encode())
+
+            content_id = part['Content-ID'][1:-1]
+            parts.append(
+                f'--{boundary}\r\nContent-Type: application/http\r\nContent-ID: <response-{content_id}>\r\n\r\n'
+                f'HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n\r\n{json.dumps(payload or {})}\r\n'
+            )
+        content = (''.join(parts) + f'--{boundary}--').encode()
+        return 200, {'Content-Type': f'multipart/mixed; boundary={boundary}'}, content
+
+    def _handle_feed(self, channel_id):
+        if channel_id not in self.uploads:
+            return 404, {'Content-Type': 'text/html'}, b'Not Found'
+
+        entries = []
+        for video_id in self.uploads[channel_id][:FEED_SIZE]:
+            video = self.videos[video_id]
+            published = video['publishedAt'].replace('Z', '+00:00')
+            entries.append(
+                f'<entry><id>yt:video:{video_id}</id><yt:videoId>{video_id}</yt:videoId>'
+                f'<yt:channelId>{channel_id}</yt:channelId><title>{escape(video["title"])}</title>'
+                f'<published>{published}</published><updated>{published}</updated>'
+                f'<media:group><media:description>{escape(video["title"])}</media:description></media:group></entry>'
+            )
+        content = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns:media="http://search.yahoo.com/mrss/"'
+            f' xmlns="http://www.w3.org/2005/Atom"><title>{channel_id}</title>{"".join(entries)}</feed>'
+        )
+        return 200, {'Content-Type': 'application/atom+xml; charset=UTF-8'}, content.encode()
+
+    def _handle_api(self, method, path, headers, body):
+        url = urlsplit(path)
+        resource = url.path[len(API_PREFIX) :]
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        action = {'GET': 'list', 'POST': 'insert', 'PUT': 'update'}[method]
+
+        with self.lock:
+            self.quota_used += 1 if action == 'list' else WRITE_COST
+            if action == 'list' and self.random.random() < self.rate_limit_error_rate:
+                return 403, error(403, 'rateLimitExceeded')
+
+            handler = getattr(self, f'_{resource}_{action}')
+            status, payload = handler(params, json.loads(body) if body else None, headers)
+
+        if status == 200 and 'fields' in params:
+            payload = project(payload, parse_fields(params['fields']))
+        return status, payload
+
+    def _page(self, kind, items, params, build=lambda item: item):
+        """One page of `items`, building only the resources on it with `build`."""
+        start = int(params.get('pageToken') or 0)
+        size = int(params.get('maxResults', 5))
+        page = {'kind': kind, 'etag': '', 'pageInfo': {'totalResults': len(items), 'resultsPerPage': size}}
+        page['items'] = [build(item) for item in items[start : start + size]]
+        if start + size < len(items):
+            page['nextPageToken'] = str(start + size)
+        page['etag'] = hashlib.md5(json.dumps(page, sort_keys=True).encode()).hexdigest()
+        return page
+
+    def _playlists_list(self, params, body, headers):
+        snippet = {'title': 'Sort Watch Later', 'description': '', 'thumbnails': thumbnails('PL'), 'channelId': 'UCme'}
+        return 200, {
+            'kind': 'youtube#playlistListResponse',
+            'items': [
+                {'kind': 'youtube#playlist', 'etag': etag(WATCH_LATER_ID), 'id': WATCH_LATER_ID, 'snippet': snippet}
+            ],
+        }
+
+    def _playlist_item(self, playlist_id, position, item_id, video_id, parts):
+        if video_id not in self.videos:
+            # Deleted and private videos stay listed, without details; videos.list leaves them out
+            item = {
+                'kind': 'youtube#playlistItem',
+                'etag': etag(item_id),
+                'id': item_id,
+                'snippet': {
+                    'title': 'Deleted video',
+                    'description': 'This video is unavailable.',
+                    'thumbnails': {},
+                    'playlistId': playlist_id,
+                    'position': position,
+                    'resourceId': {'kind': 'youtube#video', 'videoId': video_id},
+                },
+            }
+            if 'contentDetails' in parts:
+                item['contentDetails'] = {'videoId': video_id}
+            return item
+
+        video = self.videos[video_id]
+        item = {
+            'kind': 'youtube#playlistItem',
+            'etag': etag(item_id),
+            'id': item_id,
+            'snippet': {
+                'publishedAt': video['uploadedAt'],
+                'channelId': video['channelId'],
+                'title': video['title'],
+                'description': DESCRIPTION,
+                'thumbnails': thumbnails(video_id),
+                'channelTitle': video['channelId'],
+                'playlistId': playlist_id,
+                'position': position,
+                'resourceId': {'kind': 'youtube#video', 'videoId': video_id},
+                'videoOwnerChannelTitle': video['channelId'],
+                'videoOwnerChannelId': video['channelId'],
+            },
+        }
+        if 'contentDetails' in parts:
+            item['contentDetails'] = {'videoId': video_id, 'videoPublishedAt': video['publishedAt']}
+        return item
+
+    def _playlistItems_list(self, params, body, headers):
+        playlist_id = params['playlistId']
+        parts = params['part'].split(',')
+        if playlist_id == WATCH_LATER_ID:
+            items = list(enumerate(self.playlist))
+
+            def build(item):
+                return self._playlist_item(playlist_id, item[0], item[1]['id'], item[1]['videoId'], parts)
+        else:
+            items = list(enumerate(self.uploads['UC' + playlist_id[2:]]))
+
+            def build(item):
+                return self._playlist_item(playlist_id, item[0], f'{playlist_id}-{item[0]}', item[1], parts)
+
+        page = self._page('youtube#playlistItemListResponse', items, params, build)
+        if headers.get('if-none-match') == page['etag']:
+            return 304, None
+        if playlist_id != WATCH_LATER_ID:
+            self.uploads_pages += 1
+        return 200, page
+
+    def _playlistItems_insert(self, params, body, headers):
+        snippet = body['snippet']
+        video_id = snippet['resourceId']['videoId']
+        if any(i['videoId'] == video_id for i in self.playlist):
+            return 409, error(409, 'videoAlreadyInPlaylist')
+
+        item = {'id': f'item{self.next_item_id}', 'videoId': video_id}
+        self.next_item_id += 1
+        position = snippet.get('position', len(self.playlist))
+        self.playlist.insert(position, item)
+        return 200, self._playlist_item(WATCH_LATER_ID, position, item['id'], video_id, params['part'].split(','))
+
+    def _playlistItems_update(self, params, body, headers):
+        snippet = body['snippet']
+        if 'playlistId' not in snippet or 'videoId' not in snippet.get('resourceId', {}):
+            return 400, error(400, 'playlistIdRequired' if 'playlistId' not in snippet else 'videoIdRequired')
+
+        item = next(i for i in self.playlist if i['id'] == body['id'])
+        self.playlist.remove(item)
+        self.playlist.insert(body['snippet']['position'], item)
+        return 200, self._playlist_item(
+            WATCH_LATER_ID, body['snippet']['position'], item['id'], item['videoId'], params['part'].split(',')
+        )
+
+    def _videos_list(self, params, body, headers):
+        items = [self._video(video_id) for video_id in params['id'].split(',') if video_id in self.videos]
+        return 200, {'kind': 'youtube#videoListResponse', 'etag': etag(params['id']), 'items': items}
+
+    def _video(self, video_id):
+        video = self.videos[video_id]
+        return {
+            'kind': 'youtube#video',
+            'etag': etag(video_id),
+            'id': video_id,
+            'snippet': {
+                'publishedAt': video['publishedAt'],
+                'channelId': video['channelId'],
+                'title': video['title'],
+                'description': DESCRIPTION,
+                'thumbnails': thumbnails(video_id),
+                'channelTitle': video['channelId'],
+                'tags': ['example', 'video', 'weekly', video['channelId']],
+                'categoryId': '22',
+                'liveBroadcastContent': 'none',
+                'defaultAudioLanguage': 'en',
+                'localized': {'title': video['title'], 'description': DESCRIPTION},
+            },
+            'contentDetails': {
+                'duration': video['duration'],
+                'dimension': '2d',
+                'definition': 'hd',
+                'caption': 'false',
+                'licensedContent': True,
+                'contentRating': {},
+                'projection': 'rectangular',
+            },
+        }
+
+    def _channels_list(self, params, body, headers):
+        items = [
+            {
+                'kind': 'youtube#channel',
+                'etag': etag(channel_id),
+                'id': channel_id,
+                'contentDetails': {'relatedPlaylists': {'likes': '', 'uploads': 'UU' + channel_id[2:]}},
+            }
+            for channel_id in params['id'].split(',')
+            if channel_id in self.uploads
+        ]
+        return 200, {'kind': 'youtube#channelListResponse', 'etag': etag(params['id']), 'items': items}
+
+    def _subscriptions_list(self, params, body, headers):
+        def build(channel_id):
+            return {
+                'kind': 'youtube#subscription',
+                'etag': etag(channel_id),
+                'id': f'sub-{channel_id}',
+                'snippet': {
+                    'publishedAt': '2020-01-01T00:00:00Z',
+                    'title': channel_id,
+                    'description': DESCRIPTION,
+                    'resourceId': {'kind': 'youtube#channel', 'channelId': channel_id},
+                    'channelId': 'UCme',
+                    'thumbnails': thumbnails(channel_id),
+                },
+            }
+
+        return 200, self._page('youtube#subscriptionListResponse', self.subscriptions, params, build)
+
+
+def error(status, reason):
+    return {'error': {'code': status, 'message': reason, 'errors': [{'reason': reason, 'message': reason}]}}
+
+
+def etag(key):
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def thumbnails(key):
+    return {
+        name: {'url': f'https://i.ytimg.com/vi/{key}/{name}.jpg', 'width': width, 'height': height}
+        for name, (width, height) in THUMBNAIL_SIZES.items()
+    }
+
+
+def parse_fields(mask):
+    """Parse a partial-response `fields` mask, e.g. `items(id,snippet/title)`, into a tree of nested dicts.
+
+    An empty dict selects the whole value.
+    """
+    tree, _ = _parse_fields(mask, 0)
+    return tree
+
+
+def _parse_fields(mask, index):
+    tree = {}
+    while index < len(mask) and mask[index] != ')':
+        node = tree
+        while True:
+            end = index
+            while end < len(mask) and mask[end] not in ',/()':
+                end += 1
+            node = node.setdefault(mask[index:end], {})
+            index = end
+            if index < len(mask) and mask[index] == '/':
+                index += 1
+            else:
+                break
+
+        if index < len(mask) and mask[index] == '(':
+            subtree, index = _parse_fields(mask, index + 1)
+            node.update(subtree)
+            index += 1  # Closing paren
+        if index < len(mask) and mask[index] == ',':
+            index += 1
+    return tree, index
+
+
+def project(value, tree):
+    """Keep only the parts of `value` selected by a parsed `fields` mask; masks apply to each item of a list."""
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {key: project(value[key], subtree) for key, subtree in tree.items() if key in value}
+    return value
@@ -0,0 +1,106 @@
+#! /usr/bin/env python
+"""Microbenchmark of the `update` fetch hot loop over synthetic uploads pages.
+
+Compares `YoutubeManager.fetch_channel_videos` against the previous implementation, which wrapped every page in an
+`addict.Dict` and ran `arrow.get` on each publish date up to three times.
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+import addict
+import arrow
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import playlist_updates  # noqa: E402
+
+ITEMS = 10_000
+PAGE_SIZE = 50
+
+
+def make_pages(count):
+    """Newest-first uploads pages, one video per hour, all inside the fetch window."""
+    newest = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    items = [
+        {
+            'snippet': {
+                'title': f'Video {index}',
+                'publishedAt': (newest - timedelta(hours=index)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'channelId': 'UCbench',
+                'resourceId': {'kind': 'youtube#video', 'videoId': f'video{index:06}'},
+                'description': 'x' * 200,
+                'thumbnails': {size: {'url': 'https://i.ytimg.com/vi/x/default.jpg'} for size in ('default', 'high')},
+            }
+        }
+        for index in range(count)
+    ]
+    return [{'etag': 'etag', 'items': items[start : start + PAGE_SIZE]} for start in range(0, count, PAGE_SIZE)]
+
+
+class FakeRequest:
+    def __init__(self, pages, index=0):
+        self.pages = pages
+        self.index = index
+        self.headers = {}
+
+    def execute(self):
+        return self.pages[self.index]
+
+
+def fake_youtube(pages):
+    youtube = mock.Mock()
+    youtube.playlistItems().list.side_effect = lambda **kwargs: FakeRequest(pages)
+    youtube.playlistItems().list_next.side_effect = lambda request, response: (
+        FakeRequest(pages, request.index + 1) if request.index + 1 < len(pages) else None
+    )
+    return youtube
+
+
+def legacy_fetch(youtube, uploaded_after, uploaded_until=None):
+    videos = []
+    request = youtube.playlistItems().list(part='snippet', playlistId='uploads', maxResults=50)
+    while request:
+        response = addict.Dict(request.execute())
+        videos_on_page = [i for i in response['items'] if i.snippet.resourceId.kind == 'youtube#video']
+        videos.extend(
+            {'id': i.snippet.resourceId.videoId, 'title': i.snippet.title, 'published_at': i.snippet.publishedAt}
+            for i in videos_on_page
+            if arrow.get(i.snippet.publishedAt) >= uploaded_after
+            and (uploaded_until is None or arrow.get(i.snippet.publishedAt) < uploaded_until)
+        )
+        if any(arrow.get(i.snippet.publishedAt) < uploaded_after for i in videos_on_page):
+            break
+        request = youtube.playlistItems().list_next(request, response)
+    return videos
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    pages = make_pages(ITEMS)
+    uploaded_after = arrow.get('2000-01-01')
+    uploaded_until = arrow.get('2030-01-01')
+
+    manager = playlist_updates.YoutubeManager(dry_run=True)
+    with mock.patch.object(playlist_updates.YoutubeManager, 'youtube', fake_youtube(pages)):
+        legacy_seconds, legacy = timed(lambda: legacy_fetch(manager.youtube, uploaded_after, uploaded_until))
+        current_seconds, current = timed(
+            lambda: manager.fetch_channel_videos('uploads', uploaded_after, uploaded_until)
+        )
+
+    assert [i['id'] for i in legacy] == [i.id for i in current]
+    print(f'{ITEMS} items in {len(pages)} pages')
+    print(f'legacy (addict + arrow): {legacy_seconds * 1000:8.1f}ms')
+    print(f'typed records:           {current_seconds * 1000:8.1f}ms ({legacy_seconds / current_seconds:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
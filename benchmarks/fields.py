@@ -0,0 +1,172 @@
+#! /usr/bin/env python
+"""Check the partial-response `fields` masks in playlist_updates, and measure what they save.
+
+The check runs every list call against the offline YouTube API stand-in with and without masks and fails if the
+parsed results differ, i.e. if a mask leaves out something the parsing code reads, then sorts a playlist through
+the masked responses. The benchmark compares payload bytes and JSON decode time of full and masked responses for a
+5,000-item playlist.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+import arrow
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from end_to_end import fake_api  # noqa: E402
+from fake_youtube import API_PREFIX, WATCH_LATER_ID, FakeYoutube  # noqa: E402
+
+import playlist_updates  # noqa: E402
+
+MASKS = [name for name in dir(playlist_updates) if name.endswith('_FIELDS')]
+PLAYLIST_SIZE = 5_000
+DECODE_REPEATS = 5
+
+
+def seed(playlist_size, channel_size=50):
+    fake = FakeYoutube()
+    video_ids = []
+    for channel in range(max(playlist_size // channel_size, 1)):
+        video_ids += fake.add_channel(f'UCfields{channel}', channel_size)
+    video_ids = video_ids[:playlist_size]
+    random.Random(playlist_size).shuffle(video_ids)
+    fake.add_to_playlist(video_ids)
+    return fake
+
+
+def collect(fake, masked):
+    """Everything the app reads out of each kind of list call, with or without the masks."""
+    masks = {name: getattr(playlist_updates, name) for name in MASKS}
+    with fake_api(fake):
+        try:
+            if not masked:
+                for name in MASKS:
+                    setattr(playlist_updates, name, None)
+
+            manager = playlist_updates.YoutubeManager(dry_run=True)
+            playlist_videos, video_info = manager.get_playlist_with_info(manager.get_watchlater_playlist())
+            channels = manager.get_subscribed_channels()
+            details = manager.get_channel_details([channel['id'] for channel in channels])
+            uploads = details[channels[0]['id']].contentDetails.relatedPlaylists.uploads
+            return {
+                'playlist_videos': playlist_videos,
+                'video_info': video_info,
+                'channels': channels,
+                'uploads': {key: value.contentDetails.relatedPlaylists.uploads for key, value in details.items()},
+                'channel_videos': manager.fetch_channel_videos(uploads, arrow.get(0), etags={}),
+            }
+        finally:
+            for name, mask in masks.items():
+                setattr(playlist_updates, name, mask)
+
+
+def check():
+    full = collect(seed(120), masked=False)
+    masked = collect(seed(120), masked=True)
+
+    # Playlist items are only read for these, and sent back whole to playlistItems.update
+    def item_fields(item):
+        snippet = item['snippet']
+        return item['id'], snippet['playlistId'], snippet['title'], snippet['position'], snippet['resourceId']
+
+    full['playlist_videos'] = [item_fields(i) for i in full['playlist_videos']]
+    masked['playlist_videos'] = [item_fields(i) for i in masked['playlist_videos']]
+    for key in full:
+        assert full[key] == masked[key], f'masked {key} differ from unmasked ones'
+
+    fake = seed(120)
+    with fake_api(fake), contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        playlist_updates.YoutubeManager(dry_run=False).sort()
+    infos = fake.videos
+    ordered = [item['videoId'] for item in fake.playlist]
+    assert ordered == sorted(ordered, key=lambda i: f"{infos[i]['channelId']}-{infos[i]['publishedAt']}"), 'not sorted'
+    print(f'ok   {len(MASKS)} fields masks cover what the app reads')
+
+
+def pages(fake, resource, params):
+    """Raw JSON of every page of a list call, straight from the stand-in's handlers."""
+    result = []
+    params = {'part': 'snippet', **params, 'maxResults': 50}
+    while True:
+        status, payload = fake._handle_api('GET', f'{API_PREFIX}{resource}?{urlencode(params)}', {}, b'')
+        assert status == 200, payload
+        result.append(json.dumps(payload))
+        if 'nextPageToken' not in payload:
+            return result
+        params['pageToken'] = payload['nextPageToken']
+
+
+def decode_seconds(raw_pages):
+    best = float('inf')
+    for _ in range(DECODE_REPEATS):
+        start = time.perf_counter()
+        for page in raw_pages:
+            json.loads(page)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(playlist_size):
+    fake = seed(playlist_size)
+    video_ids = [item['videoId'] for item in fake.playlist]
+    channel_ids = fake.subscriptions
+    calls = [
+        ('playlistItems (playlist)', 'playlistItems', {'playlistId': WATCH_LATER_ID}, 'PLAYLIST_ITEMS_FIELDS'),
+        (
+            'playlistItems (uploads)',
+            'playlistItems',
+            {'playlistId': 'UU' + channel_ids[0][2:], 'part': 'snippet,contentDetails'},
+            'UPLOADS_FIELDS',
+        ),
+        ('subscriptions', 'subscriptions', {'mine': 'true'}, 'SUBSCRIPTIONS_FIELDS'),
+    ]
+    calls += [
+        ('videos', 'videos', {'id': ','.join(video_ids[start : start + 50])}, 'VIDEOS_FIELDS')
+        for start in range(0, len(video_ids), 50)
+    ]
+    calls += [
+        ('channels', 'channels', {'id': ','.join(channel_ids[start : start + 50])}, 'CHANNELS_FIELDS')
+        for start in range(0, len(channel_ids), 50)
+    ]
+
+    totals = {}
+    for name, resource, params, mask in calls:
+        full = pages(fake, resource, params)
+        masked = pages(fake, resource, {**params, 'fields': getattr(playlist_updates, mask)})
+        total = totals.setdefault(name, [0, 0, 0, 0.0, 0.0])
+        total[0] += len(full)
+        total[1] += sum(map(len, full))
+        total[2] += sum(map(len, masked))
+        total[3] += decode_seconds(full)
+        total[4] += decode_seconds(masked)
+
+    print(f'{playlist_size} item playlist, {len(channel_ids)} channels')
+    print(f"{'endpoint':<26} {'pages':>6} {'full KB':>9} {'masked KB':>10} {'full ms':>9} {'masked ms':>10}")
+    for name, (count, full_bytes, masked_bytes, full_seconds, masked_seconds) in totals.items():
+        print(
+            f'{name:<26} {count:6} {full_bytes / 1024:9.0f} {masked_bytes / 1024:10.0f}'
+            f' {full_seconds * 1000:9.1f} {masked_seconds * 1000:10.1f}'
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--check', action='store_true', help='Only check that the masks cover what the app reads.')
+    parser.add_argument('--size', type=int, default=PLAYLIST_SIZE, help='Playlist size to benchmark.')
+    args = parser.parse_args()
+
+    check()
+    if not args.check:
+        bench(args.size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#! /usr/bin/env python
+"""Startup-time benchmark for the CLI.
+
+Runs each subcommand's `--help` and `subscriptions list` under `python -X importtime` and fails if import time
+exceeds the budget, or if a command imports a heavy dependency it has no use for.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / 'playlist_updates.py'
+
+# Import time budget per command, in milliseconds. Override with STARTUP_BUDGET_MS on slow machines.
+BUDGET_MS = float(os.environ.get('STARTUP_BUDGET_MS', 200))
+
+# None of these commands talk to the YouTube API or prompt, so none of them should pay for these modules
+FORBIDDEN_MODULES = {'googleapiclient', 'oauth2client', 'httplib2', 'InquirerPy', 'arrow', 'isodate'}
+
+COMMANDS = [
+    ['--help'],
+    ['sort', '--help'],
+    ['update', '--help'],
+    ['watch', '--help'],
+    ['subscriptions', '--help'],
+    ['subscriptions', 'list'],
+]
+
+
+def measure(args, env):
+    """Returns total import time in milliseconds and the set of top-level packages imported."""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', str(SCRIPT), *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total_us = 0
+    packages = set()
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        packages.add(name.strip().split('.')[0])
+        # Only top-level imports; nested ones are already counted in their parent's cumulative time
+        if not name.startswith('  '):
+            total_us += int(cumulative)
+    return total_us / 1000, packages
+
+
+def main():
+    failed = False
+    with tempfile.TemporaryDirectory() as cache_home:
+        env = {**os.environ, 'XDG_CACHE_HOME': cache_home}
+        for args in COMMANDS:
+            elapsed_ms, packages = measure(args, env)
+            forbidden = sorted(packages & FORBIDDEN_MODULES)
+            ok = elapsed_ms <= BUDGET_MS and not forbidden
+            failed |= not ok
+
+            print(f"{'ok  ' if ok else 'FAIL'} {' '.join(args):<25} {elapsed_ms:7.1f}ms / {BUDGET_MS:.0f}ms")
+            if forbidden:
+                print(f"     imported heavy dependencies: {', '.join(forbidden)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
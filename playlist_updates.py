@@ -1,34 +1,62 @@
 #! /usr/bin/env python
+from __future__ import annotations
+
 import asyncio
+import bisect
+import contextlib
+import heapq
+import inspect
+import itertools
+import json
 import operator
 import os
+import random
+import signal
 import sys
 import threading
+import time
 from collections import namedtuple
-from functools import cached_property, lru_cache, reduce
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache, reduce, wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import addict
-import arrow
-import googleapiclient.errors
-import httplib2
-import oauth2client.client
-import oauth2client.file
-import oauth2client.tools
 import typer
 import yaml
-from apiclient.discovery import build
-from InquirerPy import inquirer
-from InquirerPy.base.control import Choice
-from isodate import parse_duration, strftime
-from rich.console import Console
-from rich.markup import escape
-from rich.table import Table
-from tqdm import tqdm
 from xdg import XDG_CACHE_HOME
 
-print = tqdm.write
+# Heavy dependencies (google api client, oauth2client, InquirerPy, rich, tqdm, arrow, isodate) are imported inside the
+# functions that use them, so commands that only touch local files (e.g. `subscriptions list`) start up quickly.
+# `make bench-startup` guards this.
+if TYPE_CHECKING:
+    import arrow
+    import googleapiclient.errors
+    import httplib2
+    import oauth2client.client
+    from googleapiclient.http import HttpRequest
+
+
+def print(message: str = '') -> None:
+    """Print without breaking any active progress bar."""
+    from tqdm import tqdm
+
+    tqdm.write(message)
 
 
 # The CLIENT_SECRETS_FILE variable specifies the name of a file that contains
@@ -65,23 +93,364 @@ https://developers.google.com/api-client-library/python/guide/aaa_client_secrets
 YOUTUBE_READ_WRITE_SCOPE = 'https://www.googleapis.com/auth/youtube'
 YOUTUBE_API_SERVICE_NAME = 'youtube'
 YOUTUBE_API_VERSION = 'v3'
+# Set to send API calls somewhere other than Google, e.g. the offline stand-in used by the benchmarks
+YOUTUBE_API_ROOT_URL = os.environ.get('YOUTUBE_API_ROOT_URL')
+# Public, unauthenticated, quota-free feed of each channel's latest uploads
+YOUTUBE_FEED_URL = os.environ.get('YOUTUBE_FEED_URL', 'https://www.youtube.com/feeds/videos.xml')
+FEED_SIZE = 15  # Uploads listed per channel feed
+FEED_TIMEOUT = 10  # Seconds
+ATOM_NAMESPACE = '{http://www.w3.org/2005/Atom}'
+YT_NAMESPACE = '{http://www.youtube.com/xml/schemas/2015}'
 
 DAILY_QUOTA = 10_000
+QUOTA_TIMEZONE = 'US/Pacific'  # Daily quota resets at midnight Pacific time
 INSERT_COST = 50
-MAX_INSERTS_PER_RUN = int(DAILY_QUOTA * 0.8 / INSERT_COST)  # 160
+UPDATE_COST = 50
+# Quota units per API method; anything not listed (i.e. list calls) costs 1
+QUOTA_COSTS = {'insert': INSERT_COST, 'update': UPDATE_COST, 'delete': 50}
+BATCH_SIZE = 50  # Max requests per multipart batch call
+
+# Partial-response masks for list calls, selecting only the fields their callers read. Full snippets carry
+# descriptions, thumbnails and localizations we never use. Keep these in step with the parsing code; the offline API
+# stand-in enforces them, and `make check-fields` compares masked results against unmasked ones.
+PLAYLISTS_FIELDS = 'items(id,snippet/title)'
+# Items are sent back whole to playlistItems.update, which needs the playlist and resource ids
+PLAYLIST_ITEMS_FIELDS = 'nextPageToken,items(id,snippet(playlistId,title,position,resourceId))'
+# Uploads are listed in upload order; contentDetails has the time each video was actually published
+UPLOADS_FIELDS = (
+    'etag,nextPageToken,'
+    'items(snippet(title,publishedAt,channelId,resourceId(kind,videoId)),contentDetails/videoPublishedAt)'
+)
+VIDEOS_FIELDS = 'items(id,snippet(channelId,publishedAt),contentDetails/duration)'
+SUBSCRIPTIONS_FIELDS = 'nextPageToken,items/snippet(title,resourceId/channelId)'
+CHANNELS_FIELDS = 'items(id,contentDetails/relatedPlaylists/uploads)'
+
+FETCH_CONCURRENCY = 8  # Channels fetched at once
+# Keep-alive connections shared by all API calls (and as many again for feeds): the channel fetches, plus the
+# playlist pager and a background subscription refresh. Any more concurrent requests queue for a connection.
+HTTP_POOL_SIZE = FETCH_CONCURRENCY + 2
+# API requests per second across all channel fetches, once the API has rate-limited a run. The API has no published
+# per-second limit (quota is per day), so fetches aren't throttled until it pushes back.
+FETCH_RATE_LIMIT = 10.0
+FETCH_MAX_RETRIES = 5
+FETCH_BACKOFF_BASE = 1.0  # Seconds; doubled on each retry, with full jitter
+FETCH_BACKOFF_CAP = 32.0
+# 403 reasons that mean "slow down" rather than "not allowed" (quotaExceeded is not retryable until tomorrow)
+RETRYABLE_403_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+
+WATCH_INTERVAL = 60.0  # Minutes between scheduled runs of `watch`
+TOKEN_REFRESH_MARGIN = 300  # Seconds before expiry that `watch` refreshes the OAuth access token
+TOKEN_REFRESH_MIN_WAIT = 30  # Seconds between refresh attempts, so a failing refresh doesn't spin
+
+CACHE_DIR = Path(XDG_CACHE_HOME) / 'youtube-sort-playlist'
+VIDEO_INFO_CACHE_FILE = 'video_info.json'
+QUOTA_LEDGER_FILE = 'quota.json'
+ETAGS_CACHE_FILE = 'etags.json'
+WATERMARKS_FILE = 'watermarks.json'
+UPDATE_JOURNAL_FILE = 'update_journal.json'
+SUBSCRIPTIONS_CACHE_FILE = 'subscriptions.json'
+SUBSCRIPTIONS_TTL = 24 * 60 * 60  # Seconds the cached subscription list is trusted
 
 VideoInfo = namedtuple('VideoInfo', ['channel_id', 'published_date', 'duration'])
+# A channel upload in the update pipeline; published_at is epoch seconds, parsed once when the page is read
+ChannelVideo = namedtuple('ChannelVideo', ['id', 'title', 'published_at', 'channel_id'])
 JsonType = Dict[str, Any]
 
 
+class QuotaLedger:
+    """Persistent record of quota units spent today, by API method.
+
+    Every API call is charged as it is made, including calls from earlier runs on the same quota day, so commands
+    can size their work from the quota that is actually left.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        ledger = read_cache_file(QUOTA_LEDGER_FILE)
+        self.day = self.quota_day()
+        self.methods: Dict[str, int] = ledger.get('methods', {}) if ledger.get('day') == self.day else {}
+
+    @staticmethod
+    def quota_day() -> str:
+        import arrow
+
+        return arrow.now(QUOTA_TIMEZONE).format('YYYY-MM-DD')
+
+    @property
+    def used(self) -> int:
+        return sum(self.methods.values())
+
+    @property
+    def remaining(self) -> int:
+        return max(DAILY_QUOTA - self.used, 0)
+
+    def record(self, method_id: str) -> None:
+        cost = quota_cost(method_id)
+        with self._lock:
+            if self.day != self.quota_day():
+                self.day = self.quota_day()
+                self.methods = {}
+            self.methods[method_id] = self.methods.get(method_id, 0) + cost
+            write_cache_file(QUOTA_LEDGER_FILE, {'day': self.day, 'methods': self.methods})
+
+
+class UpdateJournal:
+    """Per-channel fetch watermarks, and a write-ahead journal of fetched videos that aren't in the playlist yet.
+
+    Once a channel's uploads are fetched up to `window_end`, the channel and its videos are journaled before any
+    of them are inserted. The channel's watermark only moves to the end of its window once every one of its videos
+    has been inserted, so a watermark never passes a video that never made it into the playlist. After an aborted
+    update, the next run inserts the journaled videos without refetching, channels that finished only fetch what's
+    new since, and channels that never finished are refetched from their old watermark.
+
+    Watermarks and windows are epoch seconds. Nothing is written in dry runs.
+    """
+
+    def __init__(self, window_end: int, persist: bool = True) -> None:
+        self.window_end = window_end
+        self.persist = persist
+        self.watermarks: Dict[str, int] = read_cache_file(WATERMARKS_FILE)
+        journal = read_cache_file(UPDATE_JOURNAL_FILE)
+        self.windows: Dict[str, int] = journal.get('windows', {})  # Fetched channels with videos still pending
+        self.pending: List[ChannelVideo] = [ChannelVideo(*video) for video in journal.get('pending', [])]
+
+    def record_fetch(self, channel_id: str, videos: List[ChannelVideo], until: Optional[int] = None) -> None:
+        """Journal a channel's fetched videos, before any of them are inserted."""
+        self.windows[channel_id] = until if until is not None else self.window_end
+        self.pending.extend(videos)
+        self._advance()
+
+    def record_inserted(self, videos: List[ChannelVideo]) -> None:
+        """Drop inserted (or already present) videos from the journal, advancing channels that have none left."""
+        inserted = {video.id for video in videos}
+        self.pending = [video for video in self.pending if video.id not in inserted]
+        self._advance()
+
+    def _advance(self) -> None:
+        waiting = {video.channel_id for video in self.pending}
+        for channel_id in [i for i in self.windows if i not in waiting]:
+            self.watermarks[channel_id] = max(self.windows.pop(channel_id), self.watermarks.get(channel_id, 0))
+
+        if self.persist:
+            write_cache_file(UPDATE_JOURNAL_FILE, {'windows': self.windows, 'pending': self.pending})
+            write_cache_file(WATERMARKS_FILE, self.watermarks)
+
+
+class Profiler:
+    """Per-phase timings and per-endpoint API call stats, collected when `--profile` is passed."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.endpoints: Dict[str, Dict[str, float]] = {}
+
+    def record_phase(self, name: str, seconds: float) -> None:
+        with self._lock:
+            phase = self.phases.setdefault(name, {'calls': 0, 'seconds': 0.0})
+            phase['calls'] += 1
+            phase['seconds'] += seconds
+
+    def record_call(self, method_id: str, seconds: float, size: int) -> None:
+        with self._lock:
+            endpoint = self.endpoints.setdefault(method_id, {'calls': 0, 'seconds': 0.0, 'bytes': 0, 'quota': 0})
+            endpoint['calls'] += 1
+            endpoint['seconds'] += seconds
+            endpoint['bytes'] += size
+            endpoint['quota'] += quota_cost(method_id)
+
+    def report(self, json_path: Optional[Path] = None) -> None:
+        """Print summary tables, and write the raw stats as JSON to `json_path` if given."""
+        from rich.console import Console
+        from rich.table import Table
+
+        phases = Table('Phase', 'Calls', 'Total (s)', title='Phases')
+        for name, phase in sorted(self.phases.items(), key=lambda i: -i[1]['seconds']):
+            phases.add_row(name, str(phase['calls']), f"{phase['seconds']:.2f}")
+
+        endpoints = Table('Endpoint', 'Calls', 'Total (s)', 'Mean (ms)', 'Bytes', 'Quota', title='API calls')
+        for name, endpoint in sorted(self.endpoints.items(), key=lambda i: -i[1]['seconds']):
+            endpoints.add_row(
+                name,
+                str(endpoint['calls']),
+                f"{endpoint['seconds']:.2f}",
+                f"{endpoint['seconds'] / endpoint['calls'] * 1000:.0f}",
+                str(endpoint['bytes']),
+                str(endpoint['quota']),
+            )
+
+        console = Console(stderr=True)
+        console.print(phases)
+        console.print(endpoints)
+
+        if json_path:
+            with open(json_path, 'w', encoding='utf-8') as file:
+                json.dump({'phases': self.phases, 'endpoints': self.endpoints}, file, indent=2)
+
+
+def profiled(function: Callable) -> Callable:
+    """Time each call of a YoutubeManager phase when profiling.
+
+    Async generators are timed while producing items, not while suspended as their consumer handles one, so a
+    consumer's own phases aren't counted twice.
+    """
+    name = function.__name__
+
+    if inspect.isasyncgenfunction(function):
+
+        @wraps(function)
+        async def async_generator_wrapper(*args, **kwargs):
+            elapsed = 0.0
+            resumed = time.perf_counter()
+            generator = function(*args, **kwargs)
+            try:
+                async for item in generator:
+                    elapsed += time.perf_counter() - resumed
+                    resumed = None
+                    yield item
+                    resumed = time.perf_counter()
+            finally:
+                if resumed is not None:
+                    elapsed += time.perf_counter() - resumed
+                await generator.aclose()
+                if get_profiler().enabled:
+                    get_profiler().record_phase(name, elapsed)
+
+        return async_generator_wrapper
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            if get_profiler().enabled:
+                get_profiler().record_phase(name, time.perf_counter() - start)
+
+    return wrapper
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` acquisitions per second, in bursts of up to `capacity`.
+
+    A bucket that isn't `engaged` lets every acquisition through until `engage` is called.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, engaged: bool = True) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.engaged = engaged
+        self._lock = threading.Lock()
+
+    def engage(self) -> None:
+        with self._lock:
+            if not self.engaged:
+                self.engaged = True
+                self.tokens = self.capacity
+                self.updated = time.monotonic()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        if not self.engaged:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class HttpPool:
+    """Thread-safe stand-in for httplib2.Http that lends each request one of up to `size` keep-alive clients.
+
+    httplib2.Http keeps one connection per host and must not be used by two threads at once, but the API client
+    only ever calls `request` on it. So a single pool can back one service object shared by all threads, with
+    connections capped at the pool size rather than growing with the number of worker threads. Clients are made on
+    demand and the most recently used one is lent first, so its connection is the least likely to have gone stale.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], httplib2.Http],
+        size: int = HTTP_POOL_SIZE,
+        credentials: Optional[oauth2client.client.Credentials] = None,
+    ) -> None:
+        self.factory = factory
+        # googleapiclient batches look for this to refresh an expired token before sending
+        self.credentials = credentials
+        self._idle: List[httplib2.Http] = []
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+
+    def request(self, *args, **kwargs) -> Tuple[httplib2.Response, bytes]:
+        with self._slots:
+            with self._lock:
+                http = self._idle.pop() if self._idle else None
+            if http is None:
+                http = self.factory()
+            try:
+                return http.request(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._idle.append(http)
+
+
+class PlaylistIndex:
+    """Local view of the 'Sort Watch Later' playlist, kept in step with inserts as an update runs.
+
+    Membership lets inserts skip videos already in the playlist before spending quota on a 409. Sort keys, in
+    position order, are only kept when inserting at sorted positions.
+    """
+
+    def __init__(self, video_ids: Iterable[str], sort_keys: Optional[List[str]] = None) -> None:
+        self.video_ids = set(video_ids)
+        self.sort_keys = sort_keys
+        self.skipped = 0
+
+    def __contains__(self, video_id: str) -> bool:
+        return video_id in self.video_ids
+
+    def new_videos(self, videos: Iterable[ChannelVideo]) -> Iterator[ChannelVideo]:
+        """Yields the videos not yet in the playlist, counting the rest as skipped."""
+        for video in videos:
+            if video.id in self.video_ids:
+                self.skipped += 1
+            else:
+                yield video
+
+    def position(self, video: ChannelVideo) -> Optional[int]:
+        """Position that keeps the playlist sorted, or None when appending."""
+        if self.sort_keys is None:
+            return None
+        return bisect.bisect_right(
+            self.sort_keys, playlist_sort_key(video.channel_id, format_timestamp(video.published_at))
+        )
+
+    def add(self, video: ChannelVideo, position: Optional[int] = None) -> None:
+        self.video_ids.add(video.id)
+        if self.sort_keys is not None and position is not None:
+            self.sort_keys.insert(position, playlist_sort_key(video.channel_id, format_timestamp(video.published_at)))
+
+
 class YoutubeManager:
     def __init__(self, dry_run: bool) -> None:
         self.dry_run = dry_run
-        self._thread_local = threading.local()
+        self._runner: Optional[asyncio.Runner] = None
 
     @staticmethod
     def get_creds() -> oauth2client.client.Credentials:
         """Authorize client with OAuth2."""
+        import oauth2client.client
+        import oauth2client.file
+        import oauth2client.tools
+
         flow = oauth2client.client.flow_from_clientsecrets(
             CLIENT_SECRETS_FILE, message=MISSING_CLIENT_SECRETS_MESSAGE, scope=YOUTUBE_READ_WRITE_SCOPE
         )
@@ -104,20 +473,122 @@ class YoutubeManager:
         """
         return self.get_creds()
 
-    @property
+    def run_async(self, coroutine: Coroutine) -> Any:
+        """Run a coroutine on the manager's event loop.
+
+        The loop is kept for the manager's lifetime, and with it the default executor's worker threads. So repeated
+        runs from `watch` reuse warm threads, as well as the manager's pooled clients and connections.
+        """
+        if self._runner is None:
+            self._runner = asyncio.Runner()
+        return self._runner.run(coroutine)
+
+    def close(self) -> None:
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+
+    def keep_credentials_fresh(self, stop: threading.Event) -> None:
+        """Refresh the OAuth access token shortly before it expires, until `stop` is set.
+
+        Saves a long-running `watch` from a 401 and a refresh round trip in the middle of a run.
+        """
+        import httplib2
+
+        while True:
+            expiry = getattr(self._credentials, 'token_expiry', None)  # Naive UTC
+            wait = float(TOKEN_REFRESH_MIN_WAIT)
+            if expiry is not None:
+                now = datetime.now(timezone.utc).replace(tzinfo=None)
+                wait = max((expiry - now).total_seconds() - TOKEN_REFRESH_MARGIN, wait)
+            if stop.wait(wait):
+                return
+
+            try:
+                self._credentials.refresh(httplib2.Http())
+            except Exception as error:
+                print(f'Token refresh failed, retrying later: {error}')
+
+    @cached_property
     def youtube(self):
-        """Thread-local youtube data v3 object.
+        """Youtube data v3 object, built once and shared by every thread.
 
-        httplib2.Http is not thread-safe: it keeps a single per-host connection cache, so sharing one
-        instance across the threads used for concurrent channel fetches/inserts causes requests to
-        interleave on the same socket (hangs, or worse, native heap corruption). Each thread lazily
-        builds and keeps its own client.
+        Its requests go through an HttpPool rather than a single httplib2.Http, which isn't thread-safe, so
+        concurrent channel fetches, lookups and inserts share one set of keep-alive connections.
         """
-        if not hasattr(self._thread_local, 'youtube'):
-            self._thread_local.youtube = build(
-                YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, http=self._credentials.authorize(httplib2.Http())
-            )
-        return self._thread_local.youtube
+        import httplib2
+        from googleapiclient.discovery import build_from_document
+
+        return build_from_document(
+            get_discovery_document(),
+            http=HttpPool(lambda: self._credentials.authorize(httplib2.Http()), credentials=self._credentials),
+            requestBuilder=metered_http_request_class(),
+        )
+
+    @cached_property
+    def feed_http(self) -> HttpPool:
+        """Keep-alive HTTP clients for channel feeds, which don't need credentials."""
+        import httplib2
+
+        return HttpPool(lambda: httplib2.Http(timeout=FEED_TIMEOUT))
+
+    def execute_batch(self, requests: List[HttpRequest]) -> List[Union[JsonType, googleapiclient.errors.HttpError]]:
+        """Execute requests as multipart batches, returning each request's response or error in request order.
+
+        Up to BATCH_SIZE requests share one HTTP round trip. A failed request doesn't fail the rest of its batch;
+        its HttpError is returned in its slot for the caller to handle. When profiling, each request is charged an
+        equal share of its batch's round trip, and the size of its own part of the response.
+        """
+        import googleapiclient.errors
+
+        results: List[Union[JsonType, googleapiclient.errors.HttpError]] = [{}] * len(requests)
+
+        profiler = get_profiler()
+        sizes: Dict[int, int] = {}
+
+        def measured(index: int, postproc: Callable) -> Callable:
+            def measured_postproc(resp, content):
+                sizes[index] = len(content)
+                return postproc(resp, content)
+
+            return measured_postproc
+
+        def callback(request_id: str, response: JsonType, exception: Optional[googleapiclient.errors.HttpError]):
+            get_quota_ledger().record(requests[int(request_id)].methodId)
+            results[int(request_id)] = exception if exception is not None else response
+
+        for start in range(0, len(requests), BATCH_SIZE):
+            chunk = requests[start : start + BATCH_SIZE]
+            batch = self.youtube.new_batch_http_request(callback=callback)
+            for index, request in enumerate(chunk, start):
+                if profiler.enabled:
+                    # The batch hands each part's body to its request's postproc
+                    request.postproc = measured(index, request.postproc)
+                batch.add(request, request_id=str(index))
+
+            started = time.perf_counter()
+            batch.execute()
+
+            if profiler.enabled:
+                share = (time.perf_counter() - started) / len(chunk)
+                for index, (request, result) in enumerate(zip(chunk, results[start : start + BATCH_SIZE]), start):
+                    if isinstance(result, googleapiclient.errors.HttpError):
+                        size = len(result.content)
+                    else:
+                        size = sizes.get(index, 0)
+                    profiler.record_call(request.methodId, share, size)
+
+        return results
+
+    def execute_batch_or_raise(self, requests: List[HttpRequest]) -> List[JsonType]:
+        """Like `execute_batch`, but for reads where any failed request should abort the caller."""
+        import googleapiclient.errors
+
+        responses = self.execute_batch(requests)
+        for response in responses:
+            if isinstance(response, googleapiclient.errors.HttpError):
+                raise response
+        return cast(List[JsonType], responses)
 
     @lru_cache(1)
     def get_watchlater_playlist(self) -> str:
@@ -126,77 +597,153 @@ class YoutubeManager:
         The 'Sort Watch Later' playlist is regular playlist and is not the same as the magical one that all
         youtube users have by default.
         """
-        playlists = self.youtube.playlists().list(part='snippet', mine=True).execute()
+        playlists = self.youtube.playlists().list(part='snippet', mine=True, fields=PLAYLISTS_FIELDS).execute()
         playlist_id = next(i['id'] for i in playlists['items'] if i['snippet']['title'] == 'Sort Watch Later')
         return playlist_id
 
+    @profiled
     def get_playlist_videos(self, watchlater_id: str) -> List[JsonType]:
         """Returns list of playlistItems from Sort Watch Later playlist"""
-        result: List[Dict] = []
+        return [item for page in self.iter_playlist_pages(watchlater_id) for item in page]
 
-        request = self.youtube.playlistItems().list(part='snippet', playlistId=watchlater_id, maxResults=50)
-
-        # Iterate through all results pages
+    def iter_playlist_pages(self, playlist_id: str) -> Iterator[List[JsonType]]:
+        """Yields each page of a playlist's playlistItems as it arrives."""
+        request = self.youtube.playlistItems().list(
+            part='snippet', playlistId=playlist_id, maxResults=50, fields=PLAYLIST_ITEMS_FIELDS
+        )
         while request:
-            response: Dict[str, Dict] = request.execute()
+            response = request.execute()
+            yield response['items']
+            request = self.youtube.playlistItems().list_next(request, response)
 
-            result.extend(response['items'])
+    def get_video_details(self, video_ids: List[str]) -> JsonType:
+        """One videos.list response for up to 50 videos."""
+        return (
+            self.youtube.videos()
+            .list(part='snippet,contentDetails', id=','.join(video_ids), maxResults=50, fields=VIDEOS_FIELDS)
+            .execute()
+        )
 
-            # Prepare next results page
-            request = self.youtube.playlistItems().list_next(request, response)
-        return result
+    @profiled
+    def get_playlist_with_info(
+        self, watchlater_id: str, concurrency: int = FETCH_CONCURRENCY
+    ) -> Tuple[List[JsonType], Dict[str, VideoInfo]]:
+        """Returns the playlistItems of the Sort Watch Later playlist, and a dict of VideoInfo for each video
 
-    def get_video_info(self, playlist_videos: List[JsonType]) -> Dict[str, VideoInfo]:
-        """Returns a dict of VideoInfo for each video
+        The key is video id and the value is VideoInfo. Channel, publish date and duration never change after
+        upload, so they are kept in a local cache and only videos never seen before are queried. Videos that have
+        left the playlist are evicted from the cache.
 
-        The key is video id and the value is VideoInfo.
+        Lookups are pipelined with paging: as each page of up to 50 items arrives, its unseen videos go out as one
+        videos.list call on a worker thread, at most `concurrency` at a time, while the next page is being fetched.
+        So even with a cold cache, this takes about as long as paging alone.
         """
-        result = {}
-        videos = [i['snippet']['resourceId']['videoId'] for i in playlist_videos]
-
-        # Partition videos due to max number of videos queryable with one api call
-        while videos:
-            to_query = videos[:50]
-            remaining = videos[50:]
-
-            response = (
-                self.youtube.videos()
-                .list(part='snippet,contentDetails', id=','.join(list(to_query)), maxResults=50)
-                .execute()
-            )
+        return self.run_async(self._get_playlist_with_info(watchlater_id, concurrency))
+
+    async def _get_playlist_with_info(
+        self, watchlater_id: str, concurrency: int
+    ) -> Tuple[List[JsonType], Dict[str, VideoInfo]]:
+        from isodate import parse_duration
+
+        cache = read_cache_file(VIDEO_INFO_CACHE_FILE)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def look_up(video_ids: List[str]) -> JsonType:
+            async with semaphore:
+                return await asyncio.to_thread(self.get_video_details, video_ids)
 
+        loop = asyncio.get_running_loop()
+        pages: asyncio.Queue[Optional[List[JsonType]]] = asyncio.Queue()
+
+        def page_through() -> None:
+            # Pages are fetched in order on one thread, and handed to the loop as they arrive
+            try:
+                for page in self.iter_playlist_pages(watchlater_id):
+                    loop.call_soon_threadsafe(pages.put_nowait, page)
+            finally:
+                loop.call_soon_threadsafe(pages.put_nowait, None)
+
+        paging = asyncio.ensure_future(asyncio.to_thread(page_through))
+        playlist_videos: List[JsonType] = []
+        lookups = []
+        try:
+            while (page := await pages.get()) is not None:
+                playlist_videos.extend(page)
+                unseen = [i['snippet']['resourceId']['videoId'] for i in page]
+                unseen = [video_id for video_id in unseen if video_id not in cache]
+                if unseen:
+                    lookups.append(asyncio.create_task(look_up(unseen)))
+
+            await paging  # Raises if paging failed
+            responses = await asyncio.gather(*lookups)
+        finally:
+            # Don't leave lookups behind on the manager's loop if paging or a lookup failed
+            for lookup in lookups:
+                lookup.cancel()
+        for response in responses:
             for i in response['items']:
-                video_id = i['id']
                 channel_id = i['snippet']['channelId']
                 published_date = i['snippet']['publishedAt']
-                duration = parse_duration(i['contentDetails']['duration'])
-                result[video_id] = VideoInfo(channel_id, published_date, duration)
+                duration = i['contentDetails']['duration']
+                cache[i['id']] = [channel_id, published_date, duration]
 
-            videos = remaining
+        # Evict videos that have left the playlist
+        video_ids = [i['snippet']['resourceId']['videoId'] for i in playlist_videos]
+        cache = {video_id: cache[video_id] for video_id in video_ids if video_id in cache}
+        write_cache_file(VIDEO_INFO_CACHE_FILE, cache)
 
-        return result
+        video_infos = {
+            video_id: VideoInfo(channel_id, published_date, parse_duration(duration))
+            for video_id, (channel_id, published_date, duration) in cache.items()
+        }
+        return playlist_videos, video_infos
 
+    @profiled
     def sort_playlist(self, playlist_videos: List[Dict], video_infos: JsonType) -> None:
-        """Sorts a playlist and groups videos by channel."""
+        """Sorts a playlist and groups videos by channel.
+
+        Only videos that are out of place relative to the rest are moved; see `plan_playlist_moves`.
+        """
 
         def sort_key(playlist_item):
-            """Groups together videos from the same channel, sorted by date in ascending order."""
             video_id = playlist_item['snippet']['resourceId']['videoId']
             channel_name, published_date, _ = video_infos[video_id]
-            return f'{channel_name}-{published_date}'
+            return playlist_sort_key(channel_name, published_date)
 
+        from tqdm import tqdm
+
+        items_by_id = {i['id']: i for i in playlist_videos}
         sorted_playlist = sorted(playlist_videos, key=sort_key)
-        for index, i in enumerate(tqdm(sorted_playlist, unit='video')):
-            print(f"{i['snippet']['title']} is being put in pos {index}")
+        moves = plan_playlist_moves([i['id'] for i in playlist_videos], [i['id'] for i in sorted_playlist])
+        print(f'Planned {len(moves)} move(s) (naive sort would update {len(sorted_playlist)} items)')
+
+        # Each move settles one more item, so a prefix of the plan is always safe to apply; the next run re-plans
+        max_moves = get_quota_ledger().remaining // UPDATE_COST
+        if len(moves) > max_moves:
+            print(f'Quota left today only covers {max_moves} of {len(moves)} moves; rerun sort tomorrow to finish.')
+            moves = moves[:max_moves]
+
+        for item_id, position in tqdm(moves, unit='video'):
+            item = items_by_id[item_id]
+            print(f"{item['snippet']['title']} is being put in pos {position}")
 
             if not self.dry_run:
-                i['snippet']['position'] = index
-                self.youtube.playlistItems().update(part='snippet', body=i).execute()
+                item['snippet']['position'] = position
+                self.youtube.playlistItems().update(part='snippet', body=item).execute()
+
+    @profiled
+    def get_subscribed_channels(self, refresh: bool = False) -> List[Dict[str, str]]:
+        """Returns subscribed channels, from the local cache unless it's older than SUBSCRIPTIONS_TTL or `refresh`."""
+        if not refresh:
+            cached = self.cached_subscriptions()
+            if cached is not None:
+                return cached
 
-    def get_subscribed_channels(self) -> List[Dict[str, str]]:
         channels: List[Dict[str, str]] = []
         next_page_token = None
-        request = self.youtube.subscriptions().list(part='snippet', mine=True, maxResults=50, pageToken=next_page_token)
+        request = self.youtube.subscriptions().list(
+            part='snippet', mine=True, maxResults=50, pageToken=next_page_token, fields=SUBSCRIPTIONS_FIELDS
+        )
 
         while request:
             response = request.execute()
@@ -204,18 +751,42 @@ class YoutubeManager:
             channels.extend({'title': i.snippet.title, 'id': i.snippet.resourceId.channelId} for i in response['items'])
             request = self.youtube.subscriptions().list_next(request, response)
 
+        write_cache_file(SUBSCRIPTIONS_CACHE_FILE, {'fetched_at': int(time.time()), 'channels': channels})
         return channels
 
-    def add_subscriptions(self) -> None:
+    @staticmethod
+    def cached_subscriptions() -> Optional[List[Dict[str, str]]]:
+        """Subscribed channels as last fetched, or None if they never were or that was over SUBSCRIPTIONS_TTL ago."""
+        cache = read_cache_file(SUBSCRIPTIONS_CACHE_FILE)
+        if 'channels' not in cache or time.time() - cache['fetched_at'] > SUBSCRIPTIONS_TTL:
+            return None
+        return cache['channels']
+
+    @staticmethod
+    def report_unsubscribed(channels: List[Dict[str, str]], subscriptions: List[Dict[str, str]]) -> List[str]:
+        """Print and return the ids of allowlisted `channels` missing from `subscriptions`."""
+        subscribed_ids = {i['id'] for i in subscriptions}
+        unsubscribed = [channel for channel in channels if channel['id'] not in subscribed_ids]
+        if unsubscribed:
+            print(
+                f"No longer subscribed to {', '.join(channel['name'] for channel in unsubscribed)},"
+                ' so they are skipped from now on. Run "subscriptions remove" to drop them from the allowlist.'
+            )
+        return [channel['id'] for channel in unsubscribed]
+
+    def add_subscriptions(self, refresh: bool = False) -> None:
         """Interactively add newly-subscribed channels to the auto-add list."""
-        channels = self.get_subscribed_channels()
+        from InquirerPy import inquirer
+        from InquirerPy.base.control import Choice
+
+        channels = self.get_subscribed_channels(refresh)
         config = read_config()
         auto_add = config.setdefault('auto_add', [])
         known_ids = {i['id'] for i in auto_add}
 
         candidates = [i for i in channels if i['id'] not in known_ids]
         if not candidates:
-            print('No new channels to add.')
+            print('No new channels to add.' + ('' if refresh else ' Pass --refresh to reload subscriptions.'))
             return
 
         choices = [Choice(channel, name=channel['title']) for channel in candidates]
@@ -229,7 +800,9 @@ class YoutubeManager:
             print('Nothing selected.')
             return
 
-        auto_add.extend({'id': channel['id'], 'name': channel['title']} for channel in selected)
+        added = [{'id': channel['id'], 'name': channel['title']} for channel in selected]
+        self.fill_uploads_playlists(added)
+        auto_add.extend(added)
 
         if not self.dry_run:
             write_config(config)
@@ -238,6 +811,10 @@ class YoutubeManager:
 
     def list_subscriptions(self) -> None:
         """Print the channels currently allowed to auto-add videos."""
+        from rich.console import Console
+        from rich.markup import escape
+        from rich.table import Table
+
         config = read_config()
         auto_add = config.get('auto_add', [])
 
@@ -253,6 +830,9 @@ class YoutubeManager:
 
     def remove_subscription(self) -> None:
         """Interactively remove channels from the auto-add list."""
+        from InquirerPy import inquirer
+        from InquirerPy.base.control import Choice
+
         config = read_config()
         auto_add = config.setdefault('auto_add', [])
 
@@ -279,153 +859,631 @@ class YoutubeManager:
 
         print(f"Removed {len(selected)} channel(s): {', '.join(channel['name'] for channel in selected)}")
 
-    def get_channel_details(self, channel_id: str) -> addict.Dict:
-        request = self.youtube.channels().list(part='contentDetails', id=channel_id)
+    def get_channel_details(self, channel_ids: List[str]) -> Dict[str, addict.Dict]:
+        """Returns channel contentDetails keyed by channel id, queried up to 50 channels per call.
 
-        # Only 1 item, since queried by id
-        channel_details = addict.Dict(request.execute()['items'][0])
-        return channel_details
+        Channels that no longer exist are absent from the result.
+        """
+        requests = [
+            self.youtube.channels().list(
+                part='contentDetails',
+                id=','.join(channel_ids[start : start + 50]),
+                maxResults=50,
+                fields=CHANNELS_FIELDS,
+            )
+            for start in range(0, len(channel_ids), 50)
+        ]
+
+        result: Dict[str, addict.Dict] = {}
+        for response in self.execute_batch_or_raise(requests):
+            result.update((i['id'], addict.Dict(i)) for i in response.get('items', []))
+        return result
+
+    def fill_uploads_playlists(self, channels: List[Dict[str, str]]) -> bool:
+        """Record each channel's uploads playlist id on its `auto_add` entry, in place.
+
+        The uploads playlist id is permanent for a channel, so it only needs looking up once. Entries that already
+        have one are left alone; the rest are looked up together. Returns whether any entry was changed.
+        """
+        missing = [channel for channel in channels if 'uploads' not in channel]
+        if not missing:
+            return False
+
+        details = self.get_channel_details([channel['id'] for channel in missing])
+        for channel in missing:
+            if channel['id'] in details:
+                channel['uploads'] = details[channel['id']].contentDetails.relatedPlaylists.uploads
+        return True
 
     def fetch_channel_videos(
-        self, channel: str, uploaded_after: arrow.Arrow, uploaded_until: Optional[arrow.Arrow] = None
-    ) -> List[JsonType]:
-        videos = []
+        self,
+        uploads_playlist: str,
+        uploaded_after: arrow.Arrow,
+        uploaded_until: Optional[arrow.Arrow] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        etags: Optional[Dict[str, JsonType]] = None,
+    ) -> Optional[List[ChannelVideo]]:
+        """Returns videos from a channel's uploads playlist that were published within the window.
+
+        `etags` maps uploads playlist ids to the ETag and newest publish date of their first page when last seen,
+        and is updated in place. If every video on that page was older than the window, the page is requested
+        conditionally: an unchanged (304) page can't hold anything new, so None is returned without parsing.
+        """
+        import googleapiclient.errors
+
+        videos: List[ChannelVideo] = []
+        after = int(uploaded_after.timestamp())
+        until = int(uploaded_until.timestamp()) if uploaded_until is not None else None
 
-        channel_details = self.get_channel_details(channel)
-        uploaded_playlist = channel_details.contentDetails.relatedPlaylists.uploads
+        request = self.youtube.playlistItems().list(
+            part='snippet,contentDetails', playlistId=uploads_playlist, maxResults=50, fields=UPLOADS_FIELDS
+        )
 
-        request = self.youtube.playlistItems().list(part='snippet', playlistId=uploaded_playlist, maxResults=50)
+        seen = etags.get(uploads_playlist) if etags is not None else None
+        if seen and (seen['newest'] is None or parse_timestamp(seen['newest']) < after):
+            request.headers['If-None-Match'] = seen['etag']
 
+        first_page = True
         while request:
-            response = addict.Dict(request.execute())
-            videos_on_page = [i for i in response['items'] if i.snippet.resourceId.kind == 'youtube#video']
-            recent_videos = [
-                {'id': i.snippet.resourceId.videoId, 'title': i.snippet.title, 'published_at': i.snippet.publishedAt}
-                for i in videos_on_page
-                if arrow.get(i.snippet.publishedAt) >= uploaded_after
-                and (uploaded_until is None or arrow.get(i.snippet.publishedAt) < uploaded_until)
-            ]
-
-            videos.extend(recent_videos)
+            if rate_limiter:
+                rate_limiter.acquire()
+            try:
+                response = request.execute()
+            except googleapiclient.errors.HttpError as error:
+                if error.resp.status == 304:
+                    return None
+                raise
+
+            newest = None
+            reached_older = False
+            for item in response['items']:
+                snippet = item['snippet']
+                if snippet['resourceId']['kind'] != 'youtube#video':
+                    continue
+
+                # The playlist is in upload order, but scheduled uploads and premieres are published later; sort
+                # keys use the video's publish time, as `sort` does
+                if parse_timestamp(snippet['publishedAt']) < after:
+                    reached_older = True
+                published_at = item.get('contentDetails', {}).get('videoPublishedAt', snippet['publishedAt'])
+                if newest is None or published_at > newest:
+                    newest = published_at
+                timestamp = parse_timestamp(published_at)
+                if timestamp >= after and (until is None or timestamp < until):
+                    video_id = snippet['resourceId']['videoId']
+                    videos.append(ChannelVideo(video_id, snippet['title'], timestamp, snippet['channelId']))
+
+            if first_page:
+                # list_next copies headers, and later pages must not be conditional on the first page's ETag
+                request.headers.pop('If-None-Match', None)
+                if etags is not None and response.get('etag'):
+                    etags[uploads_playlist] = {'etag': response['etag'], 'newest': newest}
+                first_page = False
 
             # YouTube returns newest-first; stop when we've seen a video older than our window
-            if any(arrow.get(i.snippet.publishedAt) < uploaded_after for i in videos_on_page):
+            if reached_older:
                 break
 
             request = self.youtube.playlistItems().list_next(request, response)
 
         return videos
 
-    async def fetch_all_channels_videos(
-        self, channels: List[Dict[str, str]], uploaded_after: arrow.Arrow, uploaded_until: Optional[arrow.Arrow]
-    ) -> List[JsonType]:
-        """Fetch each channel's recent videos concurrently.
+    def fetch_feed_videos(
+        self, channel_id: str, uploaded_after: arrow.Arrow, uploaded_until: Optional[arrow.Arrow] = None
+    ) -> Optional[List[ChannelVideo]]:
+        """Returns videos from a channel's public uploads feed that were published within the window.
 
-        Fetching is a pure read with no ordering requirement, so channels are processed in parallel. A failure on
-        any channel aborts the whole batch: a partial channel set must never reach the insert phase, since that
-        would let `last_updated` advance past videos we never actually looked at.
+        Feeds cost no quota, but only list the latest FEED_SIZE uploads. None is returned when the feed doesn't
+        reach back to `uploaded_after`, or can't be read, in which case the caller should fall back to the API.
         """
-        tasks = [
-            asyncio.to_thread(self.fetch_channel_videos, channel['id'], uploaded_after, uploaded_until)
-            for channel in channels
-        ]
+        from io import BytesIO
+        from xml.etree.ElementTree import ParseError, iterparse
+
+        import httplib2
+
+        after = int(uploaded_after.timestamp())
+        until = int(uploaded_until.timestamp()) if uploaded_until is not None else None
+
+        try:
+            response, content = self.feed_http.request(f'{YOUTUBE_FEED_URL}?channel_id={channel_id}')
+        except (httplib2.HttpLib2Error, OSError):
+            return None
+        if response.status != 200:
+            return None
+
+        videos: List[ChannelVideo] = []
+        entries = 0
+        try:
+            for _, element in iterparse(BytesIO(content)):
+                if element.tag != f'{ATOM_NAMESPACE}entry':
+                    continue
+                entries += 1
+
+                timestamp = parse_timestamp(element.findtext(f'{ATOM_NAMESPACE}published', ''))
+                # Feeds are newest-first, so the window is covered once an older upload shows up
+                if timestamp < after:
+                    return videos
+                if until is None or timestamp < until:
+                    video_id = element.findtext(f'{YT_NAMESPACE}videoId', '')
+                    videos.append(
+                        ChannelVideo(video_id, element.findtext(f'{ATOM_NAMESPACE}title'), timestamp, channel_id)
+                    )
+                element.clear()
+        except (ParseError, ValueError):
+            return None
+
+        # A short feed holds every upload the channel has
+        return videos if entries < FEED_SIZE else None
+
+    @profiled
+    async def fetch_all_channels_videos(
+        self,
+        channels: List[Dict[str, str]],
+        uploaded_after: arrow.Arrow,
+        uploaded_until: Optional[arrow.Arrow],
+        concurrency: int = FETCH_CONCURRENCY,
+        requests_per_second: Optional[float] = None,
+        watermarks: Optional[Dict[str, int]] = None,
+        use_feeds: bool = False,
+    ) -> AsyncIterator[Tuple[Dict[str, str], List[ChannelVideo]]]:
+        """Fetch each channel's recent videos concurrently, yielding each channel and its videos, oldest-first, as it
+        finishes.
+
+        Each channel is fetched from its entry in `watermarks` if it has one, else from `uploaded_after`. Fetching
+        is a pure read with no ordering requirement, so channels are processed in parallel, at most `concurrency` at
+        a time. API requests aren't throttled until the API rate-limits one, and from then on are held to
+        FETCH_RATE_LIMIT per second overall; an explicit `requests_per_second` applies from the start. Rate limiting
+        and transient server errors are retried with jittered exponential backoff. Any other failure, or running out
+        of retries, on any channel raises out of the iteration; channels that were already yielded keep their
+        progress, the rest aren't advanced.
+
+        With `use_feeds`, each channel's public feed is tried first, and the API is only used for channels whose
+        feed doesn't cover the window.
+        """
+        import arrow
+        from tqdm import tqdm
 
-        all_videos: List[JsonType] = []
-        for task in tqdm(asyncio.as_completed(tasks), total=len(tasks), unit='channel'):
-            channel_videos = await task
-            channel_videos.sort(key=lambda v: v['published_at'])
-            all_videos.extend(channel_videos)
+        semaphore = asyncio.Semaphore(concurrency)
+        if requests_per_second is None:
+            rate_limiter = TokenBucket(FETCH_RATE_LIMIT, engaged=False)
+        else:
+            rate_limiter = TokenBucket(requests_per_second)
+        etags = read_cache_file(ETAGS_CACHE_FILE)
+        watermarks = watermarks or {}
+        from_feeds = 0
+
+        async def fetch(channel: Dict[str, str]) -> Tuple[Dict[str, str], Optional[List[ChannelVideo]], float, int]:
+            async with semaphore:
+                start = time.monotonic()
+                retries = 0
+                after = arrow.get(watermarks[channel['id']]) if channel['id'] in watermarks else uploaded_after
+                if use_feeds:
+                    videos = await asyncio.to_thread(self.fetch_feed_videos, channel['id'], after, uploaded_until)
+                    if videos is not None:
+                        nonlocal from_feeds
+                        from_feeds += 1
+                        return channel, videos, time.monotonic() - start, retries
+                while True:
+                    try:
+                        videos = await asyncio.to_thread(
+                            self.fetch_channel_videos,
+                            channel['uploads'],
+                            after,
+                            uploaded_until,
+                            rate_limiter,
+                            etags,
+                        )
+                        return channel, videos, time.monotonic() - start, retries
+                    except Exception as error:
+                        if retries == FETCH_MAX_RETRIES or not is_retryable_error(error):
+                            raise
+                        if is_rate_limit_error(error) and not rate_limiter.engaged:
+                            print(f'Rate limited; throttling to {rate_limiter.rate:g} requests per second')
+                            rate_limiter.engage()
+                        delay = random.uniform(0, min(FETCH_BACKOFF_CAP, FETCH_BACKOFF_BASE * 2**retries))
+                        print(f"Retrying {channel['name']} in {delay:.1f}s after error: {error}")
+                        await asyncio.sleep(delay)
+                        retries += 1
+
+        latencies: List[Tuple[float, str]] = []
+        total_retries = 0
+        not_modified = 0
+        tasks = [asyncio.create_task(fetch(channel)) for channel in channels]
+        try:
+            for task in tqdm(asyncio.as_completed(tasks), total=len(tasks), unit='channel'):
+                channel, channel_videos, latency, retries = await task
+                latencies.append((latency, channel['name']))
+                total_retries += retries
+                if retries:
+                    print(f"Fetched {channel['name']} in {latency:.1f}s after {retries} retry(s)")
+
+                if channel_videos is None:
+                    not_modified += 1
+                    channel_videos = []
+
+                channel_videos.sort(key=operator.attrgetter('published_at'))
+                yield channel, channel_videos
+        finally:
+            # The manager's loop outlives this call, so fetches left behind by a failure would resume on its next run
+            for task in tasks:
+                task.cancel()
+            # ETags only describe page contents, so they stay valid even if this batch is aborted
+            write_cache_file(ETAGS_CACHE_FILE, dict(etags))
+
+        if latencies:
+            slowest_latency, slowest_channel = max(latencies)
+            print(
+                f'Fetched {len(latencies)} channel(s) with {total_retries} retries;'
+                f' slowest was {slowest_channel} at {slowest_latency:.1f}s;'
+                f' {not_modified} unchanged since last seen' + (f'; {from_feeds} read from feeds' if use_feeds else '')
+            )
 
-        return all_videos
+    async def fetch_and_insert_videos(
+        self,
+        channels: List[Dict[str, str]],
+        uploaded_after: arrow.Arrow,
+        uploaded_until: Optional[arrow.Arrow],
+        concurrency: int = FETCH_CONCURRENCY,
+        requests_per_second: Optional[float] = None,
+        get_playlist_index: Optional[Callable[[], Awaitable[PlaylistIndex]]] = None,
+        journal: Optional[UpdateJournal] = None,
+        watermarks: Optional[Dict[str, int]] = None,
+        use_feeds: bool = False,
+    ) -> None:
+        """Insert each channel's videos while the remaining channels are still being fetched.
 
-    def add_video_to_watch_later(self, video_id: JsonType) -> None:
-        print(f"Adding video to playlist: {video_id['title']}")
+        Insert order doesn't matter, so there's no need to wait for every channel before inserting. Inserts still
+        go out one batch at a time. Each channel is journaled as soon as it's fetched and its watermark advances
+        once its videos are inserted, so a failed fetch or insert only costs the unfinished work on the next run.
+        """
+        pending: List[ChannelVideo] = []
+        # Closed right away if an insert fails, so the fetches still running are cancelled with it
+        fetches = self.fetch_all_channels_videos(
+            channels, uploaded_after, uploaded_until, concurrency, requests_per_second, watermarks, use_feeds
+        )
+        async with contextlib.aclosing(fetches):
+            async for channel, channel_videos in fetches:
+                if journal:
+                    journal.record_fetch(channel['id'], channel_videos)
+                pending.extend(channel_videos)
+                if len(pending) >= BATCH_SIZE:
+                    playlist_index = await get_playlist_index() if get_playlist_index else None
+                    inserted = await asyncio.to_thread(self.insert_videos_watch_later, pending, playlist_index)
+                    if journal:
+                        journal.record_inserted(inserted)
+                    pending = []
+
+        if pending:
+            playlist_index = await get_playlist_index() if get_playlist_index else None
+            inserted = await asyncio.to_thread(self.insert_videos_watch_later, pending, playlist_index)
+            if journal:
+                journal.record_inserted(inserted)
+
+    async def fetch_oldest_videos(
+        self,
+        channels: List[Dict[str, str]],
+        uploaded_after: arrow.Arrow,
+        concurrency: int = FETCH_CONCURRENCY,
+        requests_per_second: Optional[float] = None,
+        get_playlist_index: Optional[Callable[[], Awaitable[PlaylistIndex]]] = None,
+        watermarks: Optional[Dict[str, int]] = None,
+        use_feeds: bool = False,
+    ) -> Tuple[Iterator[ChannelVideo], int]:
+        """Returns the videos across all channels, oldest-first, and the total number found.
+
+        Each channel's videos arrive already sorted, so they're combined with a lazy k-way heap merge; the caller
+        takes as many as it can afford without sorting everything. The oldest videos can come from any channel, so
+        this still waits for every channel to finish. Videos already in the playlist index are left out of both;
+        the index is only built if any videos were found.
+        """
+        channel_videos = [
+            videos
+            async for _, videos in self.fetch_all_channels_videos(
+                channels, uploaded_after, None, concurrency, requests_per_second, watermarks, use_feeds
+            )
+        ]
+        merged: Iterator[ChannelVideo] = heapq.merge(*channel_videos, key=operator.attrgetter('published_at'))
+        total = sum(len(i) for i in channel_videos)
+        if get_playlist_index is not None and total:
+            playlist_index = await get_playlist_index()
+            total -= sum(video.id in playlist_index for videos in channel_videos for video in videos)
+            merged = playlist_index.new_videos(merged)
+        return merged, total
+
+    async def build_playlist_index(self, sorted_insert: bool = False) -> PlaylistIndex:
+        """Index the videos in the 'Sort Watch Later' playlist, with their sort keys if `sorted_insert`.
+
+        Built from one playlistItems page per 50 videos (1 quota unit each, against 50 for a duplicate insert),
+        plus the local video info cache for sort keys. `update` only builds it once it has something to insert, so
+        runs that find nothing new don't page through the playlist at all.
+        """
+        watchlater_id = await asyncio.to_thread(self.get_watchlater_playlist)
+        if not sorted_insert:
+            playlist_videos = await asyncio.to_thread(self.get_playlist_videos, watchlater_id)
+            return PlaylistIndex(item['snippet']['resourceId']['videoId'] for item in playlist_videos)
+
+        playlist_videos, video_infos = await self._get_playlist_with_info(watchlater_id, FETCH_CONCURRENCY)
+        video_ids = [item['snippet']['resourceId']['videoId'] for item in playlist_videos]
+        # Deleted and private videos have no details, so no sort key; positions would be off by one per missing video
+        missing = sum(video_id not in video_infos for video_id in video_ids)
+        if missing:
+            print(f'{missing} playlist videos are deleted or private; appending new videos instead.')
+            return PlaylistIndex(video_ids)
+        sort_keys = [
+            playlist_sort_key(video_infos[video_id].channel_id, video_infos[video_id].published_date)
+            for video_id in video_ids
+        ]
+        if any(a > b for a, b in zip(sort_keys, sort_keys[1:])):
+            print("Playlist isn't sorted; appending new videos instead. Run sort first to insert in place.")
+            return PlaylistIndex(video_ids)
+        return PlaylistIndex(video_ids, sort_keys)
+
+    def build_insert_request(self, video: ChannelVideo, position: Optional[int] = None) -> HttpRequest:
+        snippet: Dict[str, Any] = {
+            'playlistId': self.get_watchlater_playlist(),
+            'resourceId': {'kind': 'youtube#video', 'videoId': video.id},
+        }
+        if position is not None:
+            snippet['position'] = position
+        return self.youtube.playlistItems().insert(part='snippet', body={'snippet': snippet})
+
+    def add_video_to_watch_later(self, video: ChannelVideo, position: Optional[int] = None) -> bool:
+        """Insert one video, at `position` if given. Returns False if it was already in the playlist."""
+        import googleapiclient.errors
+
+        print(f'Adding video to playlist: {video.title}' + (f' at pos {position}' if position is not None else ''))
         if not self.dry_run:
             try:
-                self.youtube.playlistItems().insert(
-                    part='snippet',
-                    body={
-                        'snippet': {
-                            'playlistId': self.get_watchlater_playlist(),
-                            'resourceId': {'kind': 'youtube#video', 'videoId': video_id['id']},
-                        }
-                    },
-                ).execute()
+                self.build_insert_request(video, position).execute()
             except googleapiclient.errors.HttpError as error:
                 if error.resp.status == 409:
                     print('Already in list, skipping!')
-                else:
-                    raise
-
-    def insert_videos_watch_later(self, videos: List[JsonType]) -> None:
-        """Insert videos one at a time.
-
-        Concurrent writes to the same playlist can trip YouTube API conflict responses unrelated to the
-        video actually being a duplicate, which the 409-skip handling below can't distinguish from a real
-        duplicate; inserting serially avoids that race. Insert order doesn't affect correctness either way:
-        playlist position is set later by `sort`, not by insert order. A hard failure on any video aborts
-        the whole batch so that `update()` never mints `last_updated` for a partially-inserted batch; the
-        next run retries the full batch, tolerating re-inserts via the existing 409-skip handling above.
+                    return False
+                raise
+        return True
+
+    def insert_videos_sorted(self, videos: List[ChannelVideo], playlist_index: PlaylistIndex) -> None:
+        """Insert videos one at a time, each at its sorted position, keeping `playlist_index` in step.
+
+        Positions shift with every insert, so these can't be batched.
         """
+        from tqdm import tqdm
+
         for video in tqdm(videos, unit='video'):
+            position = playlist_index.position(video)
+            if self.add_video_to_watch_later(video, position):
+                playlist_index.add(video, position)
+            else:
+                playlist_index.add(video)
+
+    @profiled
+    def insert_videos_watch_later(
+        self, videos: List[ChannelVideo], playlist_index: Optional[PlaylistIndex] = None
+    ) -> List[ChannelVideo]:
+        """Insert videos in multipart batches, or at their sorted positions if the playlist index has sort keys.
+
+        Returns the videos that are now in the playlist, whether inserted or already there. Videos already in
+        `playlist_index` are skipped without a request, and it's updated as inserts succeed.
+
+        Requests within a batch may be processed concurrently by YouTube, and concurrent writes to the same
+        playlist can trip conflict responses unrelated to the video actually being a duplicate. So a 409 from a
+        batch is never trusted: those videos are retried one at a time once every batch is sent, where the
+        409-skip handling in `add_video_to_watch_later` applies. A retry costs another full insert, so only as many
+        as today's remaining quota covers are retried; the rest are left out of the result, for the next run.
+        Insert order doesn't affect correctness: playlist position is set later by `sort`, not by insert order. A
+        hard failure on any video aborts the whole batch so that `update()` never advances a watermark past a
+        partially-inserted batch; the next run retries the full batch from the journal, tolerating re-inserts via
+        the 409-skip handling.
+        """
+        import googleapiclient.errors
+        from tqdm import tqdm
+
+        present: List[ChannelVideo] = []
+        if playlist_index is not None:
+            present = [video for video in videos if video.id in playlist_index]
+            videos = list(playlist_index.new_videos(videos))
+            if not videos:
+                return present
+            if playlist_index.sort_keys is not None:
+                self.insert_videos_sorted(videos, playlist_index)
+                return present + videos
+
+        if self.dry_run:
+            for video in videos:
+                self.add_video_to_watch_later(video)
+                if playlist_index is not None:
+                    playlist_index.add(video)
+            return present + videos
+
+        conflicts = []
+        with tqdm(total=len(videos), unit='video') as progress:
+            for start in range(0, len(videos), BATCH_SIZE):
+                chunk = videos[start : start + BATCH_SIZE]
+                responses = self.execute_batch([self.build_insert_request(video) for video in chunk])
+
+                for video, response in zip(chunk, responses):
+                    if not isinstance(response, googleapiclient.errors.HttpError):
+                        print(f'Added video to playlist: {video.title}')
+                        present.append(video)
+                        if playlist_index is not None:
+                            playlist_index.add(video)
+                    elif response.resp.status == 409:
+                        conflicts.append(video)
+                    else:
+                        raise response
+
+                progress.update(len(chunk))
+
+        affordable = get_quota_ledger().remaining // INSERT_COST
+        if len(conflicts) > affordable:
+            print(
+                f'Quota left today only covers retrying {affordable} of {len(conflicts)} conflicting inserts;'
+                ' the rest are retried on the next update.'
+            )
+        for video in conflicts[:affordable]:
             self.add_video_to_watch_later(video)
+            present.append(video)
+            if playlist_index is not None:
+                playlist_index.add(video)
+        return present
 
     def update(
         self,
         uploaded_after: Optional[arrow.Arrow],
         uploaded_until: Optional[arrow.Arrow] = None,
         auto_batch: bool = False,
+        concurrency: int = FETCH_CONCURRENCY,
+        requests_per_second: Optional[float] = None,
+        sorted_insert: bool = False,
+        use_feeds: bool = False,
+        refresh_subscriptions: bool = False,
     ) -> None:
-        channels = self.get_subscribed_channels()
+        """Queue new uploads from allowlisted channels.
+
+        Without `uploaded_after`, each channel is fetched from its own watermark, falling back to the last complete
+        update (or two weeks ago) for channels that don't have one yet. Videos journaled by an interrupted run are
+        inserted first.
+
+        Channels come straight from the allowlist; subscriptions are only used to skip channels that have been
+        unsubscribed from. The cached subscription list is used for that, and when it has expired it's reloaded in
+        the background while this runs, so newly unsubscribed channels are skipped from the next run on.
+        """
+        import arrow
+
+        # Taken before fetching, so anything uploaded while this runs is picked up next time
+        window_end = uploaded_until or arrow.now()
+        journal = UpdateJournal(int(window_end.timestamp()), persist=not self.dry_run)
+
+        if refresh_subscriptions:
+            subscriptions: Optional[List[Dict[str, str]]] = self.get_subscribed_channels(refresh=True)
+        else:
+            subscriptions = self.cached_subscriptions()
+        subscriptions_refresh = None
+        if subscriptions is None:
+            # Resolve credentials and the API client first; two threads racing on them could start two OAuth flows
+            self.youtube
+            subscriptions_refresh = threading.Thread(target=self.get_subscribed_channels, args=(True,), daemon=True)
+            subscriptions_refresh.start()
+
         config = read_config()
         auto_add = config.setdefault('auto_add', [])
 
+        watermarks: Dict[str, int] = {}
         if uploaded_after is None:
+            watermarks = journal.watermarks
             if 'last_updated' in config:
                 uploaded_after = arrow.get(config['last_updated'])
             else:
                 uploaded_after = arrow.now().shift(weeks=-2)
 
-        allowed_channel_ids = {i['id'] for i in auto_add}
-        allowed_channels = [i for i in channels if i['id'] in allowed_channel_ids]
+        allowed_channels = list(auto_add)
         if not allowed_channels:
             print('No channels in the allowlist; run "subscriptions add" to add some.')
-        all_videos = (
-            asyncio.run(self.fetch_all_channels_videos(allowed_channels, uploaded_after, uploaded_until))
-            if allowed_channels
-            else []
-        )
+        if subscriptions is not None:
+            unsubscribed = set(self.report_unsubscribed(allowed_channels, subscriptions))
+            allowed_channels = [i for i in allowed_channels if i['id'] not in unsubscribed]
 
-        effective_until = uploaded_until
-        if auto_batch and len(all_videos) > MAX_INSERTS_PER_RUN:
-            all_sorted_by_date = sorted(all_videos, key=lambda v: v['published_at'])
-            effective_until = arrow.get(all_sorted_by_date[MAX_INSERTS_PER_RUN]['published_at'])
-            all_videos = [v for v in all_videos if arrow.get(v['published_at']) < effective_until]
-            remaining = len(all_sorted_by_date) - len(all_videos)
-            print(
-                f'Batch incomplete: queuing {len(all_videos)} of {len(all_sorted_by_date)} videos'
-                f' through {effective_until}. {remaining} remaining.'
+        # Backfill channels added before uploads playlist ids were recorded
+        if self.fill_uploads_playlists(allowed_channels) and not self.dry_run:
+            write_config(config)
+        for channel in allowed_channels:
+            if 'uploads' not in channel:
+                print(f"Channel {channel['name']} no longer exists, skipping!")
+        allowed_channels = [i for i in allowed_channels if 'uploads' in i]
+
+        # Built the first time there's something to insert, so runs that find nothing new don't page the playlist
+        playlist_index: Optional[PlaylistIndex] = None
+
+        async def get_playlist_index() -> PlaylistIndex:
+            nonlocal playlist_index
+            if playlist_index is None:
+                playlist_index = await self.build_playlist_index(sorted_insert)
+            return playlist_index
+
+        if journal.pending:
+            resumed = list(journal.pending)
+            print(f'Resuming {len(resumed)} inserts from an interrupted update')
+            journal.record_inserted(self.insert_videos_watch_later(resumed, self.run_async(get_playlist_index())))
+
+        if allowed_channels and auto_batch:
+            merged, total = self.run_async(
+                self.fetch_oldest_videos(
+                    allowed_channels,
+                    uploaded_after,
+                    concurrency,
+                    requests_per_second,
+                    get_playlist_index=get_playlist_index,
+                    watermarks=watermarks,
+                    use_feeds=use_feeds,
+                )
+            )
+            # Sized after fetching, so the list calls it took are already charged
+            max_inserts = get_quota_ledger().remaining // INSERT_COST
+            # One extra video tells whether the batch is complete, and where the next one starts
+            oldest = list(itertools.islice(merged, max_inserts + 1))
+            cutoff = journal.window_end
+            if len(oldest) > max_inserts:
+                cutoff = oldest[max_inserts].published_at
+                oldest = [v for v in oldest if v.published_at < cutoff]
+                print(
+                    f'Batch incomplete: queuing {len(oldest)} of {total} videos'
+                    f' through {arrow.get(cutoff)}. {total - len(oldest)} remaining.'
+                )
+
+            by_channel: Dict[str, List[ChannelVideo]] = {channel['id']: [] for channel in allowed_channels}
+            for video in oldest:
+                by_channel.setdefault(video.channel_id, []).append(video)
+            for channel_id, videos in by_channel.items():
+                journal.record_fetch(channel_id, videos, cutoff)
+
+            if oldest:
+                journal.record_inserted(self.insert_videos_watch_later(oldest, self.run_async(get_playlist_index())))
+        elif allowed_channels:
+            self.run_async(
+                self.fetch_and_insert_videos(
+                    allowed_channels,
+                    uploaded_after,
+                    uploaded_until,
+                    concurrency,
+                    requests_per_second,
+                    get_playlist_index,
+                    journal,
+                    watermarks,
+                    use_feeds,
+                )
             )
 
-        if all_videos:
-            self.insert_videos_watch_later(all_videos)
+        if playlist_index is not None and playlist_index.skipped:
+            print(
+                f'Skipped {playlist_index.skipped} videos already in the playlist,'
+                f' saving {playlist_index.skipped * INSERT_COST} quota.'
+            )
 
         if not self.dry_run:
-            config['last_updated'] = effective_until.format() if effective_until else arrow.now().format()
+            # Default starting point for channels added to the allowlist later
+            watermark = min((journal.watermarks.get(i['id'], 0) for i in allowed_channels), default=journal.window_end)
+            config['last_updated'] = arrow.get(watermark).format()
             write_config(config)
 
+        if subscriptions_refresh is not None:
+            subscriptions_refresh.join()
+            if (subscriptions := self.cached_subscriptions()) is not None:
+                self.report_unsubscribed(allowed_channels, subscriptions)
+
+        self.print_quota()
+
     def sort(self) -> None:
         """Sort the 'Sort Watch Later' playlist."""
         watchlater_id = self.get_watchlater_playlist()
         if not watchlater_id:
             sys.exit("Oh noes, you don't have a playlist named Sort Watch Later")
 
-        playlist_videos = self.get_playlist_videos(watchlater_id)
+        playlist_videos, video_infos = self.get_playlist_with_info(watchlater_id)
 
         if playlist_videos:
-            video_infos = self.get_video_info(playlist_videos)
             self.sort_playlist(playlist_videos, video_infos)
             self.print_duration(video_infos)
+            self.print_quota()
         else:
             sys.exit(
                 'Playlist is empty! '
@@ -433,19 +1491,120 @@ class YoutubeManager:
                 'to your personal Sort Watch Later playlist?'
             )
 
+    def watch(
+        self,
+        interval: float = WATCH_INTERVAL,
+        run_sort: bool = True,
+        auto_batch: bool = True,
+        sorted_insert: bool = False,
+        use_feeds: bool = False,
+    ) -> None:
+        """Run `update`, then `sort`, every `interval` minutes, or as soon as SIGUSR1 is received, until interrupted.
+
+        One manager serves every run, so OAuth, discovery parsing, API clients and their connections, and looked-up
+        ids are paid for once instead of on every run. The access token is refreshed in the background. A failed
+        run is reported and retried at the next one; `update` resumes where it left off.
+        """
+        trigger = threading.Event()
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: trigger.set())
+
+        stop = threading.Event()
+        if hasattr(self._credentials, 'refresh'):
+            threading.Thread(target=self.keep_credentials_fresh, args=(stop,), daemon=True).start()
+
+        print(
+            f'Running update{" and sort" if run_sort else ""} every {interval:g} minutes;'
+            f' run now with: kill -USR1 {os.getpid()}'
+        )
+        try:
+            while True:
+                # Pick up allowlist changes and quota spent by other commands since the last run
+                read_config.cache_clear()
+                get_quota_ledger.cache_clear()
+                try:
+                    self.update(None, auto_batch=auto_batch, sorted_insert=sorted_insert, use_feeds=use_feeds)
+                    if run_sort:
+                        self.sort()
+                except (Exception, SystemExit) as error:
+                    print(f'Run failed: {error!r}')
+
+                trigger.wait(interval * 60)
+                trigger.clear()
+        finally:
+            stop.set()
+            self.close()
+
+    @staticmethod
+    def print_quota() -> None:
+        ledger = get_quota_ledger()
+        print(f'Quota used today: {ledger.used}/{DAILY_QUOTA} ({ledger.remaining} left)')
+
     @staticmethod
     def print_duration(video_infos: JsonType) -> None:
+        from isodate import strftime
+
         total_duration = reduce(operator.add, [video.duration for video in video_infos.values()])
         print('\n' * 2)
         print(f"Total duration of playlist is {strftime(total_duration, '%H:%M')}")
 
 
+def longest_increasing_subsequence(values: List[int]) -> List[int]:
+    """Returns the indices of one longest strictly increasing subsequence of `values`."""
+    tails: List[int] = []  # tails[k] is the index of the smallest tail of an increasing run of length k + 1
+    tail_values: List[int] = []
+    previous: List[Optional[int]] = [None] * len(values)
+
+    for index, value in enumerate(values):
+        length = bisect.bisect_left(tail_values, value)
+        previous[index] = tails[length - 1] if length else None
+        if length == len(tails):
+            tails.append(index)
+            tail_values.append(value)
+        else:
+            tails[length] = index
+            tail_values[length] = value
+
+    result: List[int] = []
+    cursor = tails[-1] if tails else None
+    while cursor is not None:
+        result.append(cursor)
+        cursor = previous[cursor]
+    return result[::-1]
+
+
+def plan_playlist_moves(current_ids: List[str], target_ids: List[str]) -> List[Tuple[str, int]]:
+    """Plan the fewest playlist position updates that turn `current_ids` into `target_ids`.
+
+    Items on a longest increasing subsequence of target positions are already in the right relative order and
+    stay put; every other item is moved exactly once. Moves are returned in target order, each placing the item
+    directly after its nearest already-settled predecessor, so the settled items always appear in target order
+    and the final playlist matches `target_ids`. Positions account for the shifts caused by earlier moves.
+    """
+    target_index = {item_id: index for index, item_id in enumerate(target_ids)}
+    stable_positions = longest_increasing_subsequence([target_index[i] for i in current_ids])
+    settled = {current_ids[i] for i in stable_positions}
+
+    playlist = list(current_ids)
+    moves: List[Tuple[str, int]] = []
+    previous_settled: Optional[str] = None
+    for item_id in target_ids:
+        if item_id not in settled:
+            playlist.remove(item_id)
+            position = playlist.index(previous_settled) + 1 if previous_settled is not None else 0
+            playlist.insert(position, item_id)
+            moves.append((item_id, position))
+            settled.add(item_id)
+        previous_settled = item_id
+
+    return moves
+
+
 @lru_cache(1)
 def read_config() -> JsonType:
-    config_dir = Path(XDG_CACHE_HOME) / 'youtube-sort-playlist'
-    config_dir.mkdir(parents=True, exist_ok=True)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-    config_file = config_dir / 'config.yaml'
+    config_file = CACHE_DIR / 'config.yaml'
     config_file.touch()
 
     with config_file.open('r') as config:
@@ -453,22 +1612,174 @@ def read_config() -> JsonType:
 
 
 def write_config(config: JsonType) -> None:
-    with open(os.path.join(XDG_CACHE_HOME, 'youtube-sort-playlist', 'config.yaml'), 'w', encoding='utf-8') as file:
+    with open(CACHE_DIR / 'config.yaml', 'w', encoding='utf-8') as file:
         yaml.safe_dump(config, stream=file, explicit_start=True, default_flow_style=False)
 
 
+def playlist_sort_key(channel_id: str, published_date: str) -> str:
+    """Groups together videos from the same channel, sorted by date in ascending order."""
+    return f'{channel_id}-{published_date}'
+
+
+def format_timestamp(timestamp: int) -> str:
+    """Format epoch seconds the way the API formats publish dates."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def parse_timestamp(timestamp: str) -> int:
+    """Parse an API RFC 3339 timestamp to epoch seconds; much cheaper than arrow in hot loops."""
+    return int(datetime.fromisoformat(timestamp).timestamp())
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Whether an API call failed transiently (rate limiting, server error, dropped connection)."""
+    import googleapiclient.errors
+
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    if not isinstance(error, googleapiclient.errors.HttpError):
+        return False
+    return is_rate_limit_error(error) or error.resp.status >= 500
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether the API asked us to slow down."""
+    import googleapiclient.errors
+
+    if not isinstance(error, googleapiclient.errors.HttpError):
+        return False
+
+    status = error.resp.status
+    if status == 403:
+        details = error.error_details if isinstance(error.error_details, list) else []
+        return any(isinstance(i, dict) and i.get('reason') in RETRYABLE_403_REASONS for i in details)
+    return status == 429
+
+
+@lru_cache(1)
+def get_discovery_document() -> JsonType:
+    """Parsed YouTube discovery document, from the static copy bundled with google-api-python-client.
+
+    Parsed once per process and shared by every thread's client, rather than re-read by each `build`.
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+
+    document = json.loads(get_static_doc(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION))
+    if YOUTUBE_API_ROOT_URL:
+        # Batch requests are addressed from rootUrl too, so this (not client_options) redirects every call
+        document['rootUrl'] = document['mtlsRootUrl'] = YOUTUBE_API_ROOT_URL
+    return document
+
+
+@lru_cache(1)
+def metered_http_request_class() -> type:
+    """HttpRequest subclass that charges the quota ledger for every execution, successful or not."""
+    from googleapiclient.http import HttpRequest
+
+    class MeteredHttpRequest(HttpRequest):
+        def execute(self, *args, **kwargs):
+            profiler = get_profiler()
+            if not profiler.enabled:
+                try:
+                    return super().execute(*args, **kwargs)
+                finally:
+                    get_quota_ledger().record(self.methodId)
+
+            sizes = []
+            postproc = self.postproc
+
+            def measured_postproc(resp, content):
+                sizes.append(len(content))
+                return postproc(resp, content)
+
+            self.postproc = measured_postproc
+            start = time.perf_counter()
+            try:
+                return super().execute(*args, **kwargs)
+            finally:
+                self.postproc = postproc
+                get_quota_ledger().record(self.methodId)
+                profiler.record_call(self.methodId, time.perf_counter() - start, sum(sizes))
+
+    return MeteredHttpRequest
+
+
+def quota_cost(method_id: str) -> int:
+    return QUOTA_COSTS.get(method_id.rsplit('.', 1)[-1], 1)
+
+
+@lru_cache(1)
+def get_profiler() -> Profiler:
+    return Profiler()
+
+
+@lru_cache(1)
+def get_quota_ledger() -> QuotaLedger:
+    return QuotaLedger()
+
+
+def read_cache_file(name: str) -> JsonType:
+    """Read a machine-managed cache file from the cache dir, treating a missing or corrupt file as empty.
+
+    Unlike `config.yaml`, these files are never hand-edited, so they are stored as JSON, which is much faster to
+    load than YAML for thousands of entries.
+    """
+    try:
+        with open(CACHE_DIR / name, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_cache_file(name: str, data: JsonType) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_DIR / name, 'w', encoding='utf-8') as file:
+        json.dump(data, file)
+
+
 app = typer.Typer(help='Tool to manage Youtube Watch Later playlist. Because they refuse to make it trivial.')
 
 
 @app.callback()
-def main(ctx: typer.Context, dry_run: bool = typer.Option(False, '--dry-run')) -> None:
+def main(
+    ctx: typer.Context,
+    dry_run: bool = typer.Option(False, '--dry-run'),
+    profile: bool = typer.Option(False, '--profile', help='Print per-phase timings and API call stats at exit.'),
+    profile_json: Optional[Path] = typer.Option(
+        None, '--profile-json', help='Also write profile stats as JSON to this file (implies --profile).'
+    ),
+) -> None:
     ctx.obj = dry_run
 
+    if profile or profile_json:
+        profiler = get_profiler()
+        profiler.enabled = True
+        ctx.call_on_close(lambda: profiler.report(profile_json))
+
+
+@app.command()
+def watch(
+    ctx: typer.Context,
+    interval: float = typer.Option(WATCH_INTERVAL, '--interval', min=1, help='Minutes between runs.'),
+    run_sort: bool = typer.Option(True, '--sort/--no-sort', help='Sort the playlist after each update.'),
+    auto_batch: bool = typer.Option(
+        True, '--auto-batch/--no-auto-batch', help='Auto-chunk inserts to stay within API quota.'
+    ),
+    sorted_insert: bool = typer.Option(
+        False, '--sorted-insert', help='Insert videos at their sorted position, so no full sort is needed after.'
+    ),
+    feeds: bool = typer.Option(False, '--feeds', help="Find uploads in channels' public feeds at no quota cost."),
+) -> None:
+    """Keep running, updating and sorting 'Watch Later' on a schedule."""
+    youtube_manager = YoutubeManager(ctx.obj)
+    youtube_manager.watch(interval, run_sort, auto_batch, sorted_insert, feeds)
+
 
 @app.command()
 def sort(ctx: typer.Context) -> None:
     """Sort 'Watch Later' playlist."""
     youtube_manager = YoutubeManager(ctx.obj)
+    ctx.call_on_close(youtube_manager.close)
     youtube_manager.sort()
 
 
@@ -478,8 +1789,29 @@ def update(
     since: Optional[str] = typer.Option(None, '--since', help='Start date to filter videos by.'),
     until: Optional[str] = typer.Option(None, '--until', help='End date to filter videos by.'),
     auto_batch: bool = typer.Option(False, '--auto-batch', help='Auto-chunk inserts to stay within API quota.'),
+    concurrency: int = typer.Option(FETCH_CONCURRENCY, '--concurrency', min=1, help='Channels to fetch at once.'),
+    rate_limit: Optional[float] = typer.Option(
+        None,
+        '--rate-limit',
+        min=0.1,
+        help='Max API requests per second while fetching channels. By default fetches are only throttled, to'
+        f' {FETCH_RATE_LIMIT:g} per second, once the API rate-limits them.',
+    ),
+    sorted_insert: bool = typer.Option(
+        False, '--sorted-insert', help='Insert videos at their sorted position, so no full sort is needed after.'
+    ),
+    feeds: bool = typer.Option(
+        False,
+        '--feeds',
+        help="Find uploads in channels' public feeds at no quota cost; the API is only used when a feed is too short.",
+    ),
+    refresh_subscriptions: bool = typer.Option(
+        False, '--refresh-subscriptions', help='Reload subscriptions now instead of using the cached list.'
+    ),
 ) -> None:
     """Add recent videos to watch later playlist."""
+    import arrow
+
     if until and auto_batch:
         raise typer.BadParameter('--until and --auto-batch are mutually exclusive.')
 
@@ -490,10 +1822,16 @@ def update(
         raise typer.BadParameter(str(error)) from error
 
     youtube_manager = YoutubeManager(ctx.obj)
+    ctx.call_on_close(youtube_manager.close)
     youtube_manager.update(
         since_arrow,
         until_arrow,
         auto_batch,
+        concurrency,
+        rate_limit,
+        sorted_insert,
+        feeds,
+        refresh_subscriptions,
     )
 
 
@@ -502,10 +1840,13 @@ app.add_typer(subscriptions_app, name='subscriptions')
 
 
 @subscriptions_app.command('add')
-def subscriptions_add(ctx: typer.Context) -> None:
+def subscriptions_add(
+    ctx: typer.Context,
+    refresh: bool = typer.Option(False, '--refresh', help='Reload subscriptions instead of using the cached list.'),
+) -> None:
     """Interactively add newly-subscribed channels."""
     youtube_manager = YoutubeManager(ctx.obj)
-    youtube_manager.add_subscriptions()
+    youtube_manager.add_subscriptions(refresh)
 
 
 @subscriptions_app.command('list')